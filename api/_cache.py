@@ -0,0 +1,107 @@
+"""Process-wide caches shared by the API handlers.
+
+Serverless instances are reused between invocations, so data cached at module
+level survives for as long as the instance stays warm.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+from fantasy_draft_tool import FantasyDraftTool
+
+SLEEPER_TTL_SECONDS = 3600
+SCRAPER_TTL_SECONDS = 900
+ROSTER_SETTINGS_CACHE_SIZE = 256
+
+_sleeper_lock = threading.Lock()
+_SLEEPER = {'ts': 0.0, 'data': None}
+
+_scraper_lock = threading.Lock()
+_SCRAPER = {'ts': 0.0, 'obj': None}
+
+_rankings_lock = threading.Lock()
+_RANKINGS: Dict[str, Tuple[tuple, object]] = {}
+
+_settings_lock = threading.Lock()
+_ROSTER_SETTINGS: "OrderedDict[str, Dict]" = OrderedDict()
+
+
+def get_sleeper_players() -> Dict[str, dict]:
+    """Return the Sleeper players dump, refreshing it at most once per TTL."""
+    if _SLEEPER['data'] is not None and time.time() - _SLEEPER['ts'] < SLEEPER_TTL_SECONDS:
+        return _SLEEPER['data']
+
+    with _sleeper_lock:
+        # Another thread may have refreshed the data while we waited
+        if _SLEEPER['data'] is not None and time.time() - _SLEEPER['ts'] < SLEEPER_TTL_SECONDS:
+            return _SLEEPER['data']
+
+        draft_tool = FantasyDraftTool("")
+        draft_tool.fetch_sleeper_data()
+        if draft_tool.sleeper_players:
+            _SLEEPER['data'] = draft_tool.sleeper_players
+            _SLEEPER['ts'] = time.time()
+
+        # Fall back to stale data if the refresh failed
+        return _SLEEPER['data'] or {}
+
+
+def get_fantasypros_scraper():
+    """Return the FantasyPros scraper result, re-scraping at most once per TTL.
+
+    A single scrape holds every scoring format, so all formats share the entry.
+    """
+    if _SCRAPER['obj'] is not None and time.time() - _SCRAPER['ts'] < SCRAPER_TTL_SECONDS:
+        return _SCRAPER['obj']
+
+    with _scraper_lock:
+        if _SCRAPER['obj'] is not None and time.time() - _SCRAPER['ts'] < SCRAPER_TTL_SECONDS:
+            return _SCRAPER['obj']
+
+        from fantasy_rankings_scraper import scrape
+        _SCRAPER['obj'] = scrape('fantasypros.com')
+        _SCRAPER['ts'] = time.time()
+        return _SCRAPER['obj']
+
+
+def _get_rankings(name: str, loader):
+    key = FantasyDraftTool.get_weekly_rankings_files_key()
+    with _rankings_lock:
+        cached = _RANKINGS.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        value = loader()
+        _RANKINGS[name] = (key, value)
+        return value
+
+
+def get_weekly_rankings() -> Dict[str, List[Dict]]:
+    """Cached FantasyDraftTool.load_weekly_rankings(), reloaded when the CSVs change."""
+    return _get_rankings('weekly', FantasyDraftTool.load_weekly_rankings)
+
+
+def get_ros_rankings() -> List[Dict]:
+    """Cached FantasyDraftTool.load_ros_rankings(), reloaded when the CSVs change."""
+    return _get_rankings('ros', FantasyDraftTool.load_ros_rankings)
+
+
+def get_league_roster_settings(league_id: str) -> Dict:
+    """Cached FantasyDraftTool.get_league_roster_settings() with LRU eviction."""
+    with _settings_lock:
+        if league_id in _ROSTER_SETTINGS:
+            _ROSTER_SETTINGS.move_to_end(league_id)
+            return _ROSTER_SETTINGS[league_id]
+
+    roster_settings = FantasyDraftTool.get_league_roster_settings(league_id)
+    if not roster_settings:
+        # Don't cache failed lookups
+        return roster_settings
+
+    with _settings_lock:
+        _ROSTER_SETTINGS[league_id] = roster_settings
+        _ROSTER_SETTINGS.move_to_end(league_id)
+        while len(_ROSTER_SETTINGS) > ROSTER_SETTINGS_CACHE_SIZE:
+            _ROSTER_SETTINGS.popitem(last=False)
+    return roster_settings
@@ -0,0 +1,87 @@
+"""JSON helpers shared by the API handlers.
+
+Uses orjson when it is installed and falls back to the standard library.
+Dataclass instances (e.g. Player) are serialized as objects by both backends.
+"""
+
+from dataclasses import asdict, is_dataclass
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+    import json
+
+# Upper bound on accepted request bodies; draft-picks posts the full player pool
+MAX_BODY_BYTES = 32 * 1024 * 1024
+
+
+class BadRequestBody(ValueError):
+    """Raised when a request body can't be read as declared; answered with status."""
+
+    status = 400
+
+
+class PayloadTooLarge(BadRequestBody):
+    """Raised when a request declares a body larger than MAX_BODY_BYTES."""
+
+    status = 413
+
+
+def _reject_body(handler, error: BadRequestBody):
+    # Whatever is left of the body would otherwise be parsed as the next
+    # keep-alive request, so drop the connection after responding
+    handler.close_connection = True
+    raise error
+
+
+def read_json_body(handler):
+    """Read the request body declared by Content-Length and parse it as JSON.
+
+    The body is read into a single pre-sized buffer and handed to the parser
+    as bytes, without an intermediate decoded string. Chunked bodies and a
+    missing, malformed or negative Content-Length are rejected, and the
+    connection is closed, since the request boundary can't be trusted.
+    """
+    if handler.headers.get('Transfer-Encoding') is not None:
+        _reject_body(handler, BadRequestBody("Transfer-Encoding is not supported; send Content-Length"))
+    raw_length = handler.headers.get('Content-Length')
+    if raw_length is None:
+        _reject_body(handler, BadRequestBody("Content-Length header is required"))
+    raw_length = raw_length.strip()
+    if not (raw_length.isascii() and raw_length.isdigit()):
+        _reject_body(handler, BadRequestBody(f"Invalid Content-Length: {raw_length!r}"))
+    length = int(raw_length)
+    if length > MAX_BODY_BYTES:
+        _reject_body(handler, PayloadTooLarge(f"Request body too large ({length} bytes)"))
+
+    buffer = bytearray(length)
+    view = memoryview(buffer)
+    offset = 0
+    while offset < length:
+        read = handler.rfile.readinto(view[offset:])
+        if not read:
+            _reject_body(handler, BadRequestBody("Request body ended before Content-Length bytes were read"))
+        offset += read
+    return loads(buffer)
+
+
+def loads(data):
+    """Parse a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj) -> bytes:
+    """Serialize obj to UTF-8 encoded JSON bytes."""
+    if orjson is not None:
+        # Accept non-str dict keys like the stdlib encoder does
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_default).encode('utf-8')
+
+
+def _default(obj):
+    if is_dataclass(obj):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -0,0 +1,75 @@
+"""Response helpers shared by the API handlers."""
+
+import gzip
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - gzip only
+    brotli = None
+
+from api._jsonio import dumps
+
+# Bodies smaller than this are sent uncompressed; the saving isn't worth it
+MIN_COMPRESS_BYTES = 1024
+
+
+def _accepted_encodings(handler) -> set:
+    """Return the content codings the client accepts, ignoring any with q=0."""
+    accepted = set()
+    for item in (handler.headers.get('Accept-Encoding') or '').split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = params.strip()
+        if q.startswith('q='):
+            try:
+                if float(q[2:]) == 0:
+                    continue
+            except ValueError:
+                pass
+        accepted.add(coding)
+    return accepted
+
+
+def _compress(handler, body: bytes):
+    """Compress body for the client if it is large enough; return (body, encoding)."""
+    if len(body) <= MIN_COMPRESS_BYTES:
+        return body, None
+
+    accepted = _accepted_encodings(handler)
+    if brotli is not None and 'br' in accepted:
+        return brotli.compress(body, quality=4), 'br'
+    if 'gzip' in accepted:
+        return gzip.compress(body, compresslevel=1), 'gzip'
+    return body, None
+
+
+def respond(handler, status: int, payload) -> None:
+    """Send payload as a JSON response with CORS and Content-Length headers.
+
+    Large bodies are compressed with Brotli or gzip when the client accepts it.
+    The handlers serve HTTP/1.1 keep-alive (protocol_version), so every response
+    here and in respond_preflight() must set Content-Length: it is how the
+    client finds the end of a body on a connection that stays open.
+    """
+    body, encoding = _compress(handler, dumps(payload))
+    handler.send_response(status)
+    handler.send_header('Content-Type', 'application/json')
+    if encoding:
+        handler.send_header('Content-Encoding', encoding)
+    handler.send_header('Vary', 'Accept-Encoding')
+    handler.send_header('Content-Length', str(len(body)))
+    handler.send_header('Access-Control-Allow-Origin', '*')
+    handler.end_headers()
+    handler.wfile.write(body)
+
+
+def respond_preflight(handler) -> None:
+    """Answer a CORS preflight (OPTIONS) request with an empty body."""
+    handler.send_response(200)
+    handler.send_header('Access-Control-Allow-Origin', '*')
+    handler.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+    handler.send_header('Access-Control-Allow-Headers', 'Content-Type')
+    handler.send_header('Content-Length', '0')
+    handler.end_headers()
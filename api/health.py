@@ -1,23 +1,22 @@
 from http.server import BaseHTTPRequestHandler
-import json
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api._response import respond, respond_preflight
 
 class handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    
     def do_GET(self):
         response = {
             'status': 'ok',
             'service': 'fantasyzer-api'
         }
         
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode('utf-8'))
+        respond(self, 200, response)
     
     def do_OPTIONS(self):
-        self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        self.end_headers()
+        respond_preflight(self)
 
@@ -1,25 +1,22 @@
 from http.server import BaseHTTPRequestHandler
-import json
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from fantasy_draft_tool import FantasyDraftTool
+from api._jsonio import BadRequestBody, read_json_body
+from api._response import respond, respond_preflight
 
 class handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    
     def do_OPTIONS(self):
-        self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        self.end_headers()
+        respond_preflight(self)
     
     def do_POST(self):
         try:
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
+            data = read_json_body(self)
             
             action = data.get('action')
             
@@ -65,20 +62,12 @@ class handler(BaseHTTPRequestHandler):
             else:
                 raise ValueError(f"Unknown action: {action}")
             
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode('utf-8'))
+            respond(self, 200, response)
             
         except Exception as e:
-            error_response = {
+            status = e.status if isinstance(e, BadRequestBody) else 500
+            respond(self, status, {
                 'success': False,
                 'error': str(e)
-            }
-            self.send_response(500)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(error_response).encode('utf-8'))
+            })
 
@@ -1,5 +1,5 @@
 from http.server import BaseHTTPRequestHandler
-import json
+from concurrent.futures import ThreadPoolExecutor
 import sys
 import os
 
@@ -7,87 +7,55 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from fantasy_draft_tool import FantasyDraftTool
+from api._cache import get_fantasypros_scraper, get_sleeper_players
+from api._jsonio import BadRequestBody, read_json_body
+from api._response import respond, respond_preflight
+
+# Index of each scoring format within the FantasyPros scraper data
+_FORMAT_INDEX = {'Standard': 1, 'Half-PPR': 2, 'PPR': 3}
 
 class handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    
     def do_OPTIONS(self):
-        self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        self.end_headers()
+        respond_preflight(self)
     
     def do_POST(self):
         try:
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
+            data = read_json_body(self)
             
             scoring_format = data.get('scoring_format', 'Standard')
             
-            # Import scraper
-            from fantasy_rankings_scraper import scrape
-            scraper = scrape('fantasypros.com')
+            # Scrape FantasyPros and load Sleeper players in parallel
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                scraper_future = executor.submit(get_fantasypros_scraper)
+                sleeper_future = executor.submit(get_sleeper_players)
+                scraper = scraper_future.result()
+                sleeper_players = sleeper_future.result()
             
-            # Get the right data based on scoring format
-            if scoring_format == 'Standard':
-                players_data = scraper.data[1]
-            elif scoring_format == 'Half-PPR':
-                players_data = scraper.data[2]
-            elif scoring_format == 'PPR':
-                players_data = scraper.data[3]
-            else:
-                players_data = scraper.data[1]
+            # Get the right data based on scoring format (unknown formats use Standard)
+            players_data = scraper.data[_FORMAT_INDEX.get(scoring_format, 1)]
             
             # Create draft tool and load data
-            draft_tool = FantasyDraftTool("")
+            draft_tool = FantasyDraftTool("", verbose=False)
             draft_tool.load_scraped_data(players_data, scoring_format)
-            draft_tool.fetch_sleeper_data()
+            draft_tool.sleeper_players = sleeper_players
             draft_tool.match_players()
             
-            # Convert players to JSON-serializable format
-            players_json = []
-            for player in draft_tool.players:
-                players_json.append({
-                    'name': player.name,
-                    'team': player.team,
-                    'position': player.position,
-                    'overall_rank': player.overall_rank,
-                    'position_rank': player.position_rank,
-                    'tier': player.tier,
-                    'bye_week': player.bye_week,
-                    'sos_season': player.sos_season,
-                    'ecr_vs_adp': player.ecr_vs_adp,
-                    'sleeper_id': player.sleeper_id,
-                    'drafted': player.drafted,
-                    'drafted_by': player.drafted_by
-                })
-            
-            # Convert sleeper players to JSON
-            sleeper_players_json = {}
-            for player_id, sleeper_player in draft_tool.sleeper_players.items():
-                sleeper_players_json[player_id] = sleeper_player
-            
+            # Player dataclasses are serialized directly by dumps()
             response = {
                 'success': True,
-                'players': players_json,
-                'sleeper_players': sleeper_players_json,
-                'count': len(players_json)
+                'players': draft_tool.players,
+                'sleeper_players': draft_tool.sleeper_players,
+                'count': len(draft_tool.players)
             }
             
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode('utf-8'))
+            respond(self, 200, response)
             
         except Exception as e:
-            error_response = {
+            status = e.status if isinstance(e, BadRequestBody) else 500
+            respond(self, status, {
                 'success': False,
                 'error': str(e)
-            }
-            self.send_response(500)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(error_response).encode('utf-8'))
+            })
 
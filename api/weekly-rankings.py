@@ -1,25 +1,40 @@
 from http.server import BaseHTTPRequestHandler
-import json
+from concurrent.futures import ThreadPoolExecutor
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from fantasy_draft_tool import FantasyDraftTool
+from api._cache import (
+    get_league_roster_settings,
+    get_ros_rankings,
+    get_sleeper_players,
+    get_weekly_rankings,
+)
+from api._jsonio import BadRequestBody, read_json_body
+from api._response import respond, respond_preflight
+
+
+def _run_concurrently(**tasks):
+    """Run independent loaders in parallel and return their results by name.
+
+    Each task is given as a ``(callable, *args)`` tuple.
+    """
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = {name: executor.submit(*task) for name, task in tasks.items()}
+        return {name: future.result() for name, future in futures.items()}
+
 
 class handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    
     def do_OPTIONS(self):
-        self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        self.end_headers()
+        respond_preflight(self)
     
     def do_POST(self):
         try:
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
+            data = read_json_body(self)
             
             action = data.get('action')
             
@@ -30,48 +45,33 @@ class handler(BaseHTTPRequestHandler):
                 if not league_id or not user_id:
                     raise ValueError("league_id and user_id are required")
                 
-                # Load weekly rankings
-                weekly_rankings = FantasyDraftTool.load_weekly_rankings()
-                
-                # Get league data
-                rosters = FantasyDraftTool.fetch_league_rosters(league_id)
-                users = FantasyDraftTool.fetch_league_users(league_id)
-                
-                # Get Sleeper players
-                draft_tool = FantasyDraftTool("")
-                draft_tool.fetch_sleeper_data()
-                sleeper_players = draft_tool.sleeper_players
+                # Load rankings, league data and Sleeper players in parallel
+                results = _run_concurrently(
+                    weekly_rankings=(get_weekly_rankings,),
+                    rosters=(FantasyDraftTool.fetch_league_rosters, league_id),
+                    sleeper_players=(get_sleeper_players,),
+                    roster_settings=(get_league_roster_settings, league_id),
+                )
+                weekly_rankings = results['weekly_rankings']
+                rosters = results['rosters']
+                sleeper_players = results['sleeper_players']
+                roster_settings = results['roster_settings']
                 
                 # Find user's roster
-                user_roster = None
-                for roster in rosters:
-                    if isinstance(roster, dict) and roster.get('owner_id') == user_id:
-                        user_roster = roster
-                        break
+                rosters_by_owner = {r['owner_id']: r for r in rosters if isinstance(r, dict) and 'owner_id' in r}
+                user_roster = rosters_by_owner.get(user_id)
                 
                 if not user_roster:
                     raise ValueError("Could not find user roster")
                 
                 user_player_ids = user_roster.get('players', [])
-                user_players_list = [{'player_id': pid} for pid in user_player_ids]
-                
-                # Get roster settings
-                roster_settings = FantasyDraftTool.get_league_roster_settings(league_id)
-                
-                # Get all league players
-                all_rosters = FantasyDraftTool.fetch_league_rosters(league_id)
-                all_league_players = []
-                for roster in all_rosters:
-                    if isinstance(roster, dict):
-                        players = roster.get('players', [])
-                        if isinstance(players, list):
-                            for player_id in players:
-                                if player_id:
-                                    all_league_players.append({'player_id': player_id})
+                
+                # Get all league players from the rosters fetched above
+                all_league_players = FantasyDraftTool.collect_league_player_ids(rosters)
                 
                 # Analyze
                 analysis = FantasyDraftTool.analyze_weekly_rankings(
-                    weekly_rankings, user_players_list, sleeper_players, 
+                    weekly_rankings, user_player_ids, sleeper_players, 
                     roster_settings, all_league_players
                 )
                 
@@ -102,39 +102,28 @@ class handler(BaseHTTPRequestHandler):
                     raise ValueError("league_id and user_id are required")
                 
                 # Similar setup as above
-                weekly_rankings = FantasyDraftTool.load_weekly_rankings()
-                rosters = FantasyDraftTool.fetch_league_rosters(league_id)
-                
-                draft_tool = FantasyDraftTool("")
-                draft_tool.fetch_sleeper_data()
-                sleeper_players = draft_tool.sleeper_players
+                results = _run_concurrently(
+                    weekly_rankings=(get_weekly_rankings,),
+                    rosters=(FantasyDraftTool.fetch_league_rosters, league_id),
+                    sleeper_players=(get_sleeper_players,),
+                    roster_settings=(get_league_roster_settings, league_id),
+                )
+                weekly_rankings = results['weekly_rankings']
+                rosters = results['rosters']
+                sleeper_players = results['sleeper_players']
+                roster_settings = results['roster_settings']
                 
-                user_roster = None
-                for roster in rosters:
-                    if isinstance(roster, dict) and roster.get('owner_id') == user_id:
-                        user_roster = roster
-                        break
+                rosters_by_owner = {r['owner_id']: r for r in rosters if isinstance(r, dict) and 'owner_id' in r}
+                user_roster = rosters_by_owner.get(user_id)
                 
                 if not user_roster:
                     raise ValueError("Could not find user roster")
                 
                 user_player_ids = user_roster.get('players', [])
-                user_players_list = [{'player_id': pid} for pid in user_player_ids]
-                
-                roster_settings = FantasyDraftTool.get_league_roster_settings(league_id)
-                
-                all_rosters = FantasyDraftTool.fetch_league_rosters(league_id)
-                all_league_players = []
-                for roster in all_rosters:
-                    if isinstance(roster, dict):
-                        players = roster.get('players', [])
-                        if isinstance(players, list):
-                            for player_id in players:
-                                if player_id:
-                                    all_league_players.append({'player_id': player_id})
+                all_league_players = FantasyDraftTool.collect_league_player_ids(rosters)
                 
                 optimal_analysis = FantasyDraftTool.analyze_optimal_lineup_with_free_agents(
-                    weekly_rankings, user_players_list, sleeper_players,
+                    weekly_rankings, user_player_ids, sleeper_players,
                     roster_settings, all_league_players
                 )
                 
@@ -152,37 +141,26 @@ class handler(BaseHTTPRequestHandler):
                 if not league_id or not user_id:
                     raise ValueError("league_id and user_id are required")
                 
-                rosters = FantasyDraftTool.fetch_league_rosters(league_id)
-                
-                draft_tool = FantasyDraftTool("")
-                draft_tool.fetch_sleeper_data()
-                sleeper_players = draft_tool.sleeper_players
+                results = _run_concurrently(
+                    rosters=(FantasyDraftTool.fetch_league_rosters, league_id),
+                    sleeper_players=(get_sleeper_players,),
+                    ros_rankings=(get_ros_rankings,),
+                )
+                rosters = results['rosters']
+                sleeper_players = results['sleeper_players']
+                ros_rankings = results['ros_rankings']
                 
-                user_roster = None
-                for roster in rosters:
-                    if isinstance(roster, dict) and roster.get('owner_id') == user_id:
-                        user_roster = roster
-                        break
+                rosters_by_owner = {r['owner_id']: r for r in rosters if isinstance(r, dict) and 'owner_id' in r}
+                user_roster = rosters_by_owner.get(user_id)
                 
                 if not user_roster:
                     raise ValueError("Could not find user roster")
                 
                 user_player_ids = user_roster.get('players', [])
-                user_players_list = [{'player_id': pid} for pid in user_player_ids]
-                
-                all_rosters = FantasyDraftTool.fetch_league_rosters(league_id)
-                all_league_players = []
-                for roster in all_rosters:
-                    if isinstance(roster, dict):
-                        players = roster.get('players', [])
-                        if isinstance(players, list):
-                            for player_id in players:
-                                if player_id:
-                                    all_league_players.append({'player_id': player_id})
-                
-                ros_rankings = FantasyDraftTool.load_ros_rankings()
+                all_league_players = FantasyDraftTool.collect_league_player_ids(rosters)
+                
                 ros_analysis = FantasyDraftTool.analyze_ros_recommendations(
-                    user_players_list, sleeper_players, all_league_players, ros_rankings
+                    user_player_ids, sleeper_players, all_league_players, ros_rankings
                 )
                 
                 response = {
@@ -197,20 +175,12 @@ class handler(BaseHTTPRequestHandler):
             else:
                 raise ValueError(f"Unknown action: {action}")
             
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(response).encode('utf-8'))
+            respond(self, 200, response)
             
         except Exception as e:
-            error_response = {
+            status = e.status if isinstance(e, BadRequestBody) else 500
+            respond(self, status, {
                 'success': False,
                 'error': str(e)
-            }
-            self.send_response(500)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(error_response).encode('utf-8'))
+            })
 
@@ -6,16 +6,234 @@ with both overall and position-specific rankings.
 """
 
 import csv
+import fnmatch
+import heapq
+import itertools
 import json
+import logging
+import os
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Optional, Tuple, Set
 import unicodedata
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import numpy as np
 from dataclasses import dataclass
+from functools import lru_cache
 import re
-from fuzzywuzzy import fuzz
-from fuzzywuzzy import process
+from rapidfuzz import fuzz, process, utils
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fall back to requests' JSON decoding
+    orjson = None
+
+# Per-row parsing diagnostics; enable DEBUG to see sample rows
+logger = logging.getLogger(__name__)
+
+
+def _build_http_session() -> requests.Session:
+    """Create a pooled HTTP session so repeated Sleeper calls reuse connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared keep-alive session, reused across requests while the process is warm
+_SESSION = _build_http_session()
+
+
+def _json_body(response: requests.Response):
+    """Decode a JSON response body, with orjson when it is installed.
+
+    Decode errors are raised as requests' JSONDecodeError so callers catching
+    requests.RequestException handle them the same way as response.json().
+    """
+    if orjson is None:
+        return response.json()
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos) from e
+
+
+# Last response body per Sleeper URL, with the validators to revalidate it
+REVALIDATION_CACHE_SIZE = 256
+_revalidation_lock = threading.Lock()
+_REVALIDATION_CACHE: "OrderedDict[str, Tuple[Dict[str, str], bytes]]" = OrderedDict()
+
+
+# Requests currently on the wire, by URL; each Future resolves to the response body
+_inflight_lock = threading.Lock()
+_INFLIGHT: Dict[str, Future] = {}
+
+
+def _loads_body(body: bytes):
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+def _get_json_revalidated(url: str):
+    """GET a JSON document, reusing the last copy when the server says it is unchanged.
+
+    Requests are made conditional with the ETag / Last-Modified of the previous
+    response, so a 304 skips downloading and parsing a fresh body. If the server
+    errors (5xx) or can't be reached, the last copy is returned when there is one.
+
+    Concurrent calls for the same URL share a single request; each caller still
+    gets its own parsed copy of the body.
+    """
+    with _inflight_lock:
+        future = _INFLIGHT.get(url)
+        leader = future is None
+        if leader:
+            future = _INFLIGHT[url] = Future()
+    if not leader:
+        return _loads_body(future.result())
+
+    try:
+        data, body = _fetch_json_revalidated(url)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(body)
+    finally:
+        with _inflight_lock:
+            del _INFLIGHT[url]
+    return data
+
+
+def _fetch_json_revalidated(url: str) -> Tuple[object, bytes]:
+    """Do the conditional GET for _get_json_revalidated; return (data, raw body)."""
+    with _revalidation_lock:
+        cached = _REVALIDATION_CACHE.get(url)
+    try:
+        resp = _SESSION.get(url, headers=cached[0] if cached else None)
+        if resp.status_code == 304 and cached:
+            return _loads_body(cached[1]), cached[1]
+        resp.raise_for_status()
+    except requests.RequestException as e:
+        client_error = isinstance(e, requests.HTTPError) and e.response is not None and e.response.status_code < 500
+        if cached is None or client_error:
+            raise
+        logger.warning("Serving cached response for %s after error: %s", url, e)
+        return _loads_body(cached[1]), cached[1]
+
+    data = _json_body(resp)
+    validators = {}
+    if resp.headers.get('ETag'):
+        validators['If-None-Match'] = resp.headers['ETag']
+    if resp.headers.get('Last-Modified'):
+        validators['If-Modified-Since'] = resp.headers['Last-Modified']
+    with _revalidation_lock:
+        _REVALIDATION_CACHE[url] = (validators, resp.content)
+        _REVALIDATION_CACHE.move_to_end(url)
+        while len(_REVALIDATION_CACHE) > REVALIDATION_CACHE_SIZE:
+            _REVALIDATION_CACHE.popitem(last=False)
+    return data, resp.content
+
+
+# Patterns used in per-row parsing and name normalization
+_RE_NONALNUM = re.compile(r"[^a-z0-9\s]")
+_RE_SUFFIX = re.compile(r"\b(jr|sr|ii|iii|iv|v)\b")
+_RE_POS = re.compile(r"([A-Z]+)(\d+)")
+_RE_POS_NUM = re.compile(r"[A-Z]+(\d+)")
+_RE_POS_PREFIX = re.compile(r"([A-Z]+)")
+_RE_UNTIL_DIGIT = re.compile(r"\D*")
+_RE_SOS_NUM = re.compile(r"(\d+)")
+_RE_SIGNED_INT = re.compile(r"-?\d+")
+
+# Accented lowercase letters common in player names, mapped to their base letter
+_ACCENT_TABLE = str.maketrans(
+    "àáâãäåèéêëìíîïòóôõöùúûüýÿñç",
+    "aaaaaaeeeeiiiiooooouuuuyync",
+)
+
+# ASCII equivalent of _RE_NONALNUM: everything but a-z, 0-9 and whitespace becomes a space
+_PUNCT_TO_SPACE = {
+    i: " " for i in range(128)
+    if not ("a" <= chr(i) <= "z" or "0" <= chr(i) <= "9" or chr(i).isspace())
+}
+
+# Placeholders FantasyPros uses for missing numeric fields
+_EMPTY_INT_FIELDS = frozenset({"", "-", "NA", "N/A"})
+
+# Weekly rankings files in the weekly_rankings folder, by position type
+_RANKINGS_FILE_PATTERNS = {
+    'OP': "FantasyPros_*_Week_*_OP_Rankings.csv",
+    'DST': "FantasyPros_*_Week_*_DST_Rankings.csv",
+    'K': "FantasyPros_*_Week_*_K_Rankings.csv",
+    'ROS': "FantasyPros_*_Ros_ALL_Rankings.csv",
+}
+
+
+def _rankings_file_order(name: str) -> Tuple[int, ...]:
+    """Sort key for rankings file names: the numbers in them (season, then week)."""
+    return tuple(int(n) for n in re.findall(r"\d+", name))
+
+
+# RapidFuzz scores are unrounded floats; fuzzywuzzy rounded to integers, so a
+# "95" there is anything from 94.5 up. Keep the thresholds matching the same pairs.
+NAME_MATCH_CUTOFF = 94.5
+FIRST_NAME_MATCH_CUTOFF = 84.5
+
+def _base_position(position_with_rank: str) -> str:
+    """Strip the rank from a weekly POS value ("WR2" -> "WR", "QB10" -> "QB")."""
+    if position_with_rank[:1].isalpha():
+        return _RE_UNTIL_DIGIT.match(position_with_rank).group()
+    return position_with_rank
+
+
+# Offensive roster slots that make up the ordered starting lineup
+_LINEUP_SLOTS = frozenset({'QB', 'RB', 'WR', 'TE', 'SUPER_FLEX', 'FLEX', 'WRRBTE_FLEX', 'WRRB_FLEX'})
+
+# Positions ranked and slotted separately from the offensive players
+_SPECIAL_TEAMS_POSITIONS = frozenset({'DEF', 'K'})
+
+# Positions that can move between flex slots
+_FLEX_ELIGIBLE = frozenset({'RB', 'WR', 'TE'})
+
+# Flex slots in the order they are filled, with the positions each one accepts
+_FLEX_SLOT_POSITIONS = {
+    'SUPER_FLEX': ('QB', 'RB', 'WR', 'TE'),
+    'FLEX': ('RB', 'WR', 'TE'),
+    'WRRBTE_FLEX': ('RB', 'WR', 'TE'),
+    'WRRB_FLEX': ('RB', 'WR'),
+}
+
+@lru_cache(maxsize=65536)
+def _normalize_name_cached(name: str) -> str:
+    """Memoized body of FantasyDraftTool._normalize_name.
+
+    The same Sleeper and FantasyPros names are normalized on every match and
+    analysis pass, so results are kept for the life of the process.
+    """
+    # Lower and remove accents; most names are plain ASCII and skip this entirely
+    name_low = name.lower()
+    if not name_low.isascii():
+        name_low = name_low.translate(_ACCENT_TABLE)
+        if not name_low.isascii():
+            # Characters outside the table: decompose and drop combining marks
+            name_low = unicodedata.normalize("NFKD", name_low)
+            name_low = "".join([c for c in name_low if not unicodedata.combining(c)])
+    # Remove punctuation
+    if name_low.isascii():
+        cleaned = name_low.translate(_PUNCT_TO_SPACE)
+    else:
+        cleaned = _RE_NONALNUM.sub(" ", name_low)
+    # Remove common suffixes, then collapse spaces
+    return " ".join(_RE_SUFFIX.sub(" ", cleaned).split())
+
+
+@dataclass(slots=True)
 class Player:
     """Represents a fantasy football player with rankings"""
     name: str
@@ -31,16 +249,53 @@ class Player:
     drafted: bool = False
     drafted_by: Optional[str] = None
 
+@dataclass(slots=True)
+class _SleeperNameIndex:
+    """Name lookups over one Sleeper players dump, used by match_players and the league analyses."""
+    full_names: Dict[str, str]                 # exact full name -> ID
+    normalized: Dict[str, str]                 # any normalized name variant -> ID
+    by_position: Dict[str, Dict[str, str]]     # position -> normalized name -> ID
+    by_last_team_position: Dict[Tuple[str, str, str], List[str]]
+    all_keys: List[str]
+    position_keys: Dict[str, List[str]]
+    # Raw Sleeper position -> normalized full names and IDs, in dump order
+    position_full_names: Dict[Optional[str], List[str]]
+    position_ids: Dict[Optional[str], List[str]]
+    # Raw Sleeper position -> normalized full name -> first ID in dump order
+    position_exact: Dict[Optional[str], Dict[str, str]]
+
+
+# (dump, index) for the most recently matched Sleeper dump; warm API instances
+# match against the same cached dump on every request
+_SLEEPER_NAME_INDEX: Tuple[Optional[dict], Optional[_SleeperNameIndex]] = (None, None)
+
+
+def _sleeper_name_index(sleeper_players: Dict[str, dict]) -> _SleeperNameIndex:
+    """Return the name index for sleeper_players, building it on first use.
+
+    The index is kept for the most recently used dump and reused while callers
+    pass the same object; a loaded dump is never modified in place.
+    """
+    global _SLEEPER_NAME_INDEX
+    source, index = _SLEEPER_NAME_INDEX
+    if source is sleeper_players and index is not None:
+        return index
+    index = FantasyDraftTool._build_sleeper_name_index(sleeper_players)
+    _SLEEPER_NAME_INDEX = (sleeper_players, index)
+    return index
+
+
 class FantasyDraftTool:
-    def __init__(self, csv_file_path: str):
+    def __init__(self, csv_file_path: str, verbose: bool = True):
         self.csv_file_path = csv_file_path
+        # Print per-player matching diagnostics
+        self.verbose = verbose
         self.players: List[Player] = []
         self.sleeper_players: Dict[str, dict] = {}
         self.sleeper_draft_id: Optional[str] = None
         self.drafted_sleeper_ids: Set[str] = set()
-        # Cache of normalized name to Sleeper player ID for faster matching
-        self._normalized_sleeper_name_to_id: Dict[str, str] = {}
-        self._position_to_normalized_names: Dict[str, Dict[str, str]] = {}
+        # (players list, its length, players by overall rank, same split by position)
+        self._rank_order: Optional[Tuple[List[Player], int, List[Player], Dict[str, List[Player]]]] = None
 
     @staticmethod
     def _normalize_name(name: str) -> str:
@@ -54,16 +309,7 @@ class FantasyDraftTool:
         """
         if not name:
             return ""
-        # Lower and remove accents
-        name_low = unicodedata.normalize("NFKD", name.lower())
-        name_low = "".join([c for c in name_low if not unicodedata.combining(c)])
-        # Remove punctuation
-        cleaned = re.sub(r"[^a-z0-9\s]", " ", name_low)
-        # Remove common suffixes
-        cleaned = re.sub(r"\b(jr|sr|ii|iii|iv|v)\b", " ", cleaned)
-        # Collapse spaces
-        cleaned = re.sub(r"\s+", " ", cleaned).strip()
-        return cleaned
+        return _normalize_name_cached(name)
     
     @staticmethod
     def _parse_int_field(value: str, default: int = 0) -> int:
@@ -73,8 +319,14 @@ class FantasyDraftTool:
         """
         if value is None:
             return default
+        # Fast path: most fields are already plain integers
+        if isinstance(value, str):
+            try:
+                return int(value)
+            except ValueError:
+                pass
         s = str(value).strip()
-        if s in {"", "-", "NA", "N/A"}:
+        if s in _EMPTY_INT_FIELDS:
             return default
         # Allow "+123" style values
         if s.startswith("+"):
@@ -83,7 +335,7 @@ class FantasyDraftTool:
             return int(s)
         except ValueError:
             # Fallback: extract first signed integer substring, if any
-            m = re.search(r"-?\d+", s)
+            m = _RE_SIGNED_INT.search(s)
             if m:
                 try:
                     return int(m.group(0))
@@ -99,60 +351,78 @@ class FantasyDraftTool:
         from io import StringIO
         csv_file = StringIO(csv_content)
         
-        reader = csv.DictReader(csv_file)
+        reader = csv.reader(csv_file)
+        header = next(reader, [])
         
         # Debug: Print column names to help with troubleshooting
         if not self.players:  # Only print once
-            print(f"CSV columns found: {list(reader.fieldnames)}")
-        
-        for row in reader:
-            try:
-                # Debug: Print first few rows to see the data
-                if len(self.players) < 3:
-                    print(f"Row data: {row}")
-                
-                # Parse position and position rank
-                pos_match = re.match(r'([A-Z]+)(\d+)', row['POS'])
-                if not pos_match:
-                    print(f"Skipping row - couldn't parse position: {row['POS']}")
+            print(f"CSV columns found: {header}")
+        
+        # Resolve column positions once rather than building a dict per row
+        columns = {name: i for i, name in enumerate(header)}
+        missing = [name for name in ('RK', 'TIERS', 'PLAYER NAME', 'TEAM', 'POS') if name not in columns]
+        if missing:
+            print(f"Missing required columns: {missing}")
+            print(f"Available columns: {header}")
+            return
+        i_rank = columns['RK']
+        i_tier = columns['TIERS']
+        i_name = columns['PLAYER NAME']
+        i_team = columns['TEAM']
+        i_pos = columns['POS']
+        # Handle both column name variations
+        i_bye = columns.get('BYE WEEK', columns.get('BYE'))
+        i_sos = columns.get('SOS SEASON', columns.get('SOS'))
+        i_ecr = columns.get('ECR VS. ADP', columns.get('ECR VS ADP'))
+        
+        def parse_rows():
+            """Yield a Player for each row that parses."""
+            for row_index, row in enumerate(reader):
+                if not row:
+                    continue
+                # Pad short rows so missing trailing fields read as empty
+                row += [''] * (len(header) - len(row))
+                try:
+                    # Debug: Log first few rows to see the data
+                    if row_index < 3 and logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Row data: %s", dict(zip(header, row)))
+                    
+                    # Parse position and position rank
+                    pos_match = _RE_POS.match(row[i_pos])
+                    if not pos_match:
+                        logger.warning("Skipping row - couldn't parse position: %s", row[i_pos])
+                        continue
+                    
+                    position = pos_match.group(1)
+                    position_rank = int(pos_match.group(2))
+                    
+                    # Parse SOS season (extract number from "X out of 5 stars")
+                    sos_field = row[i_sos] if i_sos is not None else ''
+                    sos_match = _RE_SOS_NUM.search(sos_field)
+                    sos_season = sos_field if not sos_match else f"{sos_match.group(1)}/5"
+                    
+                    ecr_vs_adp_field = row[i_ecr] if i_ecr is not None else ''
+                    bye_week_field = row[i_bye] if i_bye is not None else ''
+                    
+                    player = Player(
+                        name=row[i_name].strip(),
+                        team=row[i_team].strip(),
+                        position=position,
+                        overall_rank=int(row[i_rank]),
+                        position_rank=position_rank,
+                        tier=int(row[i_tier].strip()),
+                        bye_week=self._parse_int_field(bye_week_field, 0),
+                        sos_season=sos_season,
+                        ecr_vs_adp=self._parse_int_field(ecr_vs_adp_field, 0)
+                    )
+                    
+                    yield player
+                    
+                except ValueError as e:
+                    logger.warning("Error parsing row %s: %s", row, e)
                     continue
-                
-                position = pos_match.group(1)
-                position_rank = int(pos_match.group(2))
-                
-                # Parse SOS season (extract number from "X out of 5 stars")
-                sos_field = row.get('SOS SEASON', row.get('SOS', ''))
-                sos_match = re.search(r'(\d+)', sos_field)
-                sos_season = sos_field if not sos_match else f"{sos_match.group(1)}/5"
-                
-                # Handle both column name variations for ECR VS ADP
-                ecr_vs_adp_field = row.get('ECR VS. ADP', row.get('ECR VS ADP', ''))
-                
-                # Parse tier - handle potential string values
-                tier_value = row['TIERS']
-                if isinstance(tier_value, str):
-                    tier_value = tier_value.strip()
-                tier = int(tier_value)
-                
-                player = Player(
-                    name=row['PLAYER NAME'].strip(),
-                    team=row['TEAM'].strip(),
-                    position=position,
-                    overall_rank=int(row['RK']),
-                    position_rank=position_rank,
-                    tier=tier,
-                    bye_week=self._parse_int_field(row.get('BYE WEEK', row.get('BYE', '')), 0),
-                    sos_season=sos_season,
-                    ecr_vs_adp=self._parse_int_field(ecr_vs_adp_field, 0)
-                )
-                
-                self.players.append(player)
-                
-            except (ValueError, KeyError) as e:
-                print(f"Error parsing row: {row}")
-                print(f"Error details: {e}")
-                print(f"Available columns: {list(row.keys())}")
-                continue
+        
+        self.players.extend(parse_rows())
         
         print(f"Loaded {len(self.players)} players from FantasyPros data")
     
@@ -160,48 +430,49 @@ class FantasyDraftTool:
         """Load and parse scraped FantasyPros data"""
         print(f"Loading {scoring_format} scraped data...")
         
-        self.players = []  # Clear existing players
+        def parse_players():
+            """Yield a Player for each scraped entry that parses."""
+            for player_data in scraped_players:
+                try:
+                    # Extract data from scraped format
+                    name = player_data.get('player_name', '').strip()
+                    team = player_data.get('player_team_id', '').strip()
+                    position = player_data.get('player_position_id', '').strip()
+                    overall_rank = int(player_data.get('rank_ecr', 0))
+                    tier = int(player_data.get('tier', 1))
+                    bye_week = self._parse_int_field(player_data.get('player_bye_week', ''), 0)
+                    
+                    # Parse position rank from pos_rank field (e.g., "WR1" -> 1)
+                    pos_rank_str = player_data.get('pos_rank', '')
+                    position_rank = 0
+                    if pos_rank_str:
+                        pos_match = _RE_POS_NUM.match(pos_rank_str)
+                        if pos_match:
+                            position_rank = int(pos_match.group(1))
+                    
+                    # Set default values for missing fields
+                    sos_season = "3/5"  # Default strength of schedule
+                    ecr_vs_adp = 0      # Default ECR vs ADP difference
+                    
+                    player = Player(
+                        name=name,
+                        team=team,
+                        position=position,
+                        overall_rank=overall_rank,
+                        position_rank=position_rank,
+                        tier=tier,
+                        bye_week=bye_week,
+                        sos_season=sos_season,
+                        ecr_vs_adp=ecr_vs_adp
+                    )
+                    
+                    yield player
+                    
+                except (ValueError, KeyError) as e:
+                    logger.warning("Error parsing scraped player data %s: %s", player_data, e)
+                    continue
         
-        for player_data in scraped_players:
-            try:
-                # Extract data from scraped format
-                name = player_data.get('player_name', '').strip()
-                team = player_data.get('player_team_id', '').strip()
-                position = player_data.get('player_position_id', '').strip()
-                overall_rank = int(player_data.get('rank_ecr', 0))
-                tier = int(player_data.get('tier', 1))
-                bye_week = self._parse_int_field(player_data.get('player_bye_week', ''), 0)
-                
-                # Parse position rank from pos_rank field (e.g., "WR1" -> 1)
-                pos_rank_str = player_data.get('pos_rank', '')
-                position_rank = 0
-                if pos_rank_str:
-                    pos_match = re.match(r'[A-Z]+(\d+)', pos_rank_str)
-                    if pos_match:
-                        position_rank = int(pos_match.group(1))
-                
-                # Set default values for missing fields
-                sos_season = "3/5"  # Default strength of schedule
-                ecr_vs_adp = 0      # Default ECR vs ADP difference
-                
-                player = Player(
-                    name=name,
-                    team=team,
-                    position=position,
-                    overall_rank=overall_rank,
-                    position_rank=position_rank,
-                    tier=tier,
-                    bye_week=bye_week,
-                    sos_season=sos_season,
-                    ecr_vs_adp=ecr_vs_adp
-                )
-                
-                self.players.append(player)
-                
-            except (ValueError, KeyError) as e:
-                print(f"Error parsing scraped player data: {player_data}")
-                print(f"Error details: {e}")
-                continue
+        self.players = list(parse_players())  # Replaces existing players
         
         print(f"Loaded {len(self.players)} players from {scoring_format} scraped data")
     
@@ -215,65 +486,89 @@ class FantasyDraftTool:
         from io import StringIO
         csv_file = StringIO(csv_content)
         
-        reader = csv.DictReader(csv_file)
+        reader = csv.reader(csv_file)
+        header = next(reader, [])
         
         # Debug: Print column names to help with troubleshooting
         if not self.players:  # Only print once
-            print(f"Custom CSV columns found: {list(reader.fieldnames)}")
+            print(f"Custom CSV columns found: {header}")
+        
+        # Resolve column positions once rather than building a dict per row
+        columns = {name: i for i, name in enumerate(header)}
+        missing = [name for name in ('name', 'team', 'position', 'rank') if name not in columns]
+        if missing:
+            print(f"Missing required columns: {missing}")
+            print(f"Available columns: {header}")
+            return
+        i_name = columns['name']
+        i_team = columns['team']
+        i_position = columns['position']
+        i_rank = columns['rank']
+        # Optional columns
+        i_pos_rank = columns.get('pos_rank')
+        i_tier = columns.get('tier')
+        i_bye = columns.get('bye_week')
+        i_ecr = columns.get('ecr_vs_adp')
+        
+        def parse_rows():
+            """Yield a Player for each row that parses."""
+            for row_index, row in enumerate(reader):
+                if not row:
+                    continue
+                # Pad short rows so missing trailing fields read as empty
+                row += [''] * (len(header) - len(row))
+                try:
+                    # Debug: Log first few rows to see the data
+                    if row_index < 3 and logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Custom row data: %s", dict(zip(header, row)))
+                    
+                    # Parse position and position rank from pos_rank field if available
+                    position_rank = 0
+                    if i_pos_rank is not None and row[i_pos_rank]:
+                        pos_match = _RE_POS_NUM.match(row[i_pos_rank])
+                        if pos_match:
+                            position_rank = int(pos_match.group(1))
+                    
+                    # Parse tier with default value
+                    tier = 1  # Default tier
+                    if i_tier is not None and row[i_tier]:
+                        try:
+                            tier = int(row[i_tier])
+                        except ValueError:
+                            tier = 1
+                    
+                    # Parse bye week with default value
+                    bye_week = 0  # Default bye week
+                    if i_bye is not None and row[i_bye]:
+                        bye_week = self._parse_int_field(row[i_bye], 0)
+                    
+                    # Parse ECR vs ADP with default value
+                    ecr_vs_adp = 0  # Default ECR vs ADP difference
+                    if i_ecr is not None and row[i_ecr]:
+                        ecr_vs_adp = self._parse_int_field(row[i_ecr], 0)
+                    
+                    # Set default values for missing fields
+                    sos_season = "3/5"  # Default strength of schedule
+                    
+                    player = Player(
+                        name=row[i_name].strip(),
+                        team=row[i_team].strip(),
+                        position=row[i_position].strip(),
+                        overall_rank=int(row[i_rank]),
+                        position_rank=position_rank,
+                        tier=tier,
+                        bye_week=bye_week,
+                        sos_season=sos_season,
+                        ecr_vs_adp=ecr_vs_adp
+                    )
+                    
+                    yield player
+                    
+                except ValueError as e:
+                    logger.warning("Error parsing custom CSV row %s: %s", row, e)
+                    continue
         
-        for row in reader:
-            try:
-                # Debug: Print first few rows to see the data
-                if len(self.players) < 3:
-                    print(f"Custom row data: {row}")
-                
-                # Parse position and position rank from pos_rank field if available
-                position_rank = 0
-                if 'pos_rank' in row and row['pos_rank']:
-                    pos_match = re.match(r'[A-Z]+(\d+)', row['pos_rank'])
-                    if pos_match:
-                        position_rank = int(pos_match.group(1))
-                
-                # Parse tier with default value
-                tier = 1  # Default tier
-                if 'tier' in row and row['tier']:
-                    try:
-                        tier = int(row['tier'])
-                    except ValueError:
-                        tier = 1
-                
-                # Parse bye week with default value
-                bye_week = 0  # Default bye week
-                if 'bye_week' in row and row['bye_week']:
-                    bye_week = self._parse_int_field(row['bye_week'], 0)
-                
-                # Parse ECR vs ADP with default value
-                ecr_vs_adp = 0  # Default ECR vs ADP difference
-                if 'ecr_vs_adp' in row and row['ecr_vs_adp']:
-                    ecr_vs_adp = self._parse_int_field(row['ecr_vs_adp'], 0)
-                
-                # Set default values for missing fields
-                sos_season = "3/5"  # Default strength of schedule
-                
-                player = Player(
-                    name=row['name'].strip(),
-                    team=row['team'].strip(),
-                    position=row['position'].strip(),
-                    overall_rank=int(row['rank']),
-                    position_rank=position_rank,
-                    tier=tier,
-                    bye_week=bye_week,
-                    sos_season=sos_season,
-                    ecr_vs_adp=ecr_vs_adp
-                )
-                
-                self.players.append(player)
-                
-            except (ValueError, KeyError) as e:
-                print(f"Error parsing custom CSV row: {row}")
-                print(f"Error details: {e}")
-                print(f"Available columns: {list(row.keys())}")
-                continue
+        self.players = list(parse_rows())
         
         print(f"Loaded {len(self.players)} players from custom CSV data")
     
@@ -291,51 +586,92 @@ class FantasyDraftTool:
         print("Fetching Sleeper API data...")
         
         try:
-            response = requests.get("https://api.sleeper.app/v1/players/nfl")
+            response = _SESSION.get("https://api.sleeper.app/v1/players/nfl", timeout=30)
             response.raise_for_status()
-            self.sleeper_players = response.json()
+            self.sleeper_players = _json_body(response)
             print(f"Fetched {len(self.sleeper_players)} players from Sleeper API")
         except requests.RequestException as e:
             print(f"Error fetching Sleeper data: {e}")
             self.sleeper_players = {}
     
-    def match_players(self) -> None:
-        """Match FantasyPros players with Sleeper players using fuzzy matching"""
-        print("Matching players between FantasyPros and Sleeper...")
-        
+    def _get_sleeper_name_index(self) -> _SleeperNameIndex:
+        """Return the (shared, cached) name index for self.sleeper_players."""
+        return _sleeper_name_index(self.sleeper_players)
+
+    @staticmethod
+    def _build_sleeper_name_index(sleeper_players: Dict[str, dict]) -> _SleeperNameIndex:
+        """Normalize every Sleeper name variant once into the lookups match_players uses."""
         # Create a mapping of Sleeper player names
         sleeper_names: Dict[str, str] = {}
         normalized_map: Dict[str, str] = {}
         position_map: Dict[str, Dict[str, str]] = {}
-        for player_id, sleeper_player in self.sleeper_players.items():
+        # (normalized last name, team, position) -> Sleeper IDs for the last-name fallback
+        fallback_index: Dict[Tuple[str, str, str], List[str]] = {}
+        position_full_names: Dict[Optional[str], List[str]] = {}
+        position_ids: Dict[Optional[str], List[str]] = {}
+        position_exact: Dict[Optional[str], Dict[str, str]] = {}
+        normalize = FantasyDraftTool._normalize_name
+        for player_id, sleeper_player in sleeper_players.items():
             full_name = sleeper_player.get('full_name') or ""
-            if sleeper_player.get('full_name'):
-                sleeper_names[full_name] = player_id
-                normalized_map[self._normalize_name(full_name)] = player_id
-            # Include search_full_name if present
             search_full_name = sleeper_player.get('search_full_name')
-            if search_full_name:
-                normalized_map[self._normalize_name(search_full_name)] = player_id
-            # Include first + last combos if present
             first = sleeper_player.get('first_name') or ""
             last = sleeper_player.get('last_name') or ""
+            
+            # Normalized variants (full name, search_full_name, first + last) in
+            # that order, without repeats
+            variants: Dict[str, None] = {}
+            if full_name:
+                sleeper_names[full_name] = player_id
+                variants[normalize(full_name)] = None
+            if search_full_name:
+                variants[normalize(search_full_name)] = None
             if first and last:
-                normalized_map[self._normalize_name(f"{first} {last}")] = player_id
+                variants[normalize(f"{first} {last}")] = None
+            for variant in variants:
+                normalized_map[variant] = player_id
+            
+            raw_position = sleeper_player.get('position')
+            normalized_full_name = normalize(full_name)
+            position_full_names.setdefault(raw_position, []).append(normalized_full_name)
+            position_ids.setdefault(raw_position, []).append(player_id)
+            position_exact.setdefault(raw_position, {}).setdefault(normalized_full_name, player_id)
 
             # Build position-specific normalized map
             pos = (sleeper_player.get('position') or '').upper()
+            team = (sleeper_player.get('team') or '').upper()
+            fallback_index.setdefault((normalize(last), team, pos), []).append(player_id)
             if pos:
-                if pos not in position_map:
-                    position_map[pos] = {}
-                if full_name:
-                    position_map[pos][self._normalize_name(full_name)] = player_id
-                if search_full_name:
-                    position_map[pos][self._normalize_name(search_full_name)] = player_id
-                if first and last:
-                    position_map[pos][self._normalize_name(f"{first} {last}")] = player_id
+                position_names = position_map.setdefault(pos, {})
+                for variant in variants:
+                    position_names[variant] = player_id
+
+        # Candidate name lists for fuzzy matching
+        return _SleeperNameIndex(
+            full_names=sleeper_names,
+            normalized=normalized_map,
+            by_position=position_map,
+            by_last_team_position=fallback_index,
+            all_keys=list(normalized_map.keys()),
+            position_keys={pos: list(names.keys()) for pos, names in position_map.items()},
+            position_full_names=position_full_names,
+            position_ids=position_ids,
+            position_exact=position_exact,
+        )
+
+    def match_players(self) -> None:
+        """Match FantasyPros players with Sleeper players using fuzzy matching"""
+        print("Matching players between FantasyPros and Sleeper...")
+        
+        name_index = self._get_sleeper_name_index()
+        sleeper_names = name_index.full_names
+        normalized_map = name_index.normalized
+        position_map = name_index.by_position
+        fallback_index = name_index.by_last_team_position
+        all_candidate_keys = name_index.all_keys
+        position_candidate_keys = name_index.position_keys
         
         matched_count = 0
-        unmatched_players = []
+        pending: List[Tuple[Player, str]] = []
         for fantasypros_player in self.players:
             # Try exact match first
             if fantasypros_player.name in sleeper_names:
@@ -349,76 +685,98 @@ class FantasyDraftTool:
                 fantasypros_player.sleeper_id = normalized_map[normalized_fp]
                 matched_count += 1
                 continue
-
-            # Try fuzzy matching on normalized names (prefer same-position candidates)
-            candidates_map = position_map.get(fantasypros_player.position, {}) or normalized_map
-            candidate_keys = list(candidates_map.keys())
-            best_match = process.extractOne(
-                normalized_fp,
-                candidate_keys,
+            
+            pending.append((fantasypros_player, normalized_fp))
+        
+        # Fuzzy match the remaining players on normalized names (prefer same-position
+        # candidates), scoring each candidate pool against all its players at once
+        pending_by_pool: Dict[Optional[str], List[int]] = {}
+        for index, (fantasypros_player, _) in enumerate(pending):
+            pool = fantasypros_player.position if position_candidate_keys.get(fantasypros_player.position) else None
+            pending_by_pool.setdefault(pool, []).append(index)
+        
+        def pool_keys(pool: Optional[str]) -> List[str]:
+            return position_candidate_keys[pool] if pool is not None else all_candidate_keys
+        
+        def best_in_pool(pool: Optional[str], indices: List[int]):
+            """Return the best candidate index and score for each pending player in a pool."""
+            scores = process.cdist(
+                [pending[index][1] for index in indices],
+                pool_keys(pool),
                 scorer=fuzz.token_sort_ratio,
+                processor=None,
+                workers=1,
             )
-
-            if best_match and best_match[1] >= 95:
-                chosen_key = best_match[0]
-                
-                # Additional validation: check for common name confusions
-                fp_normalized = self._normalize_name(fantasypros_player.name).lower()
-                sleeper_normalized = chosen_key.lower()
+            # argmax keeps the first candidate on ties, like extractOne
+            best = scores.argmax(axis=1)
+            return best, scores[np.arange(len(indices)), best]
+        
+        # Pools are independent and RapidFuzz releases the GIL, so score them in parallel
+        pools = {
+            pool: indices for pool, indices in pending_by_pool.items() if pool_keys(pool)
+        }
+        pool_results = {}
+        if pools:
+            with ThreadPoolExecutor(max_workers=min(len(pools), os.cpu_count() or 1, 8)) as executor:
+                futures = {pool: executor.submit(best_in_pool, pool, indices) for pool, indices in pools.items()}
+                pool_results = {pool: future.result() for pool, future in futures.items()}
+        
+        fuzzy_matches: Dict[int, str] = {}
+        # Best candidate per pending player, kept for the unmatched report
+        best_candidates: Dict[int, Tuple[str, float]] = {}
+        for pool, (best, best_scores) in pool_results.items():
+            indices = pools[pool]
+            candidates_map = position_map[pool] if pool is not None else normalized_map
+            candidate_keys = pool_keys(pool)
+            for row, best_index in enumerate(best):
+                chosen_key = candidate_keys[best_index]
+                best_candidates[indices[row]] = (chosen_key, float(best_scores[row]))
+                if best_scores[row] < NAME_MATCH_CUTOFF:
+                    continue
+                normalized_fp = pending[indices[row]][1]
                 
                 # Reject matches if first names are completely different
-                fp_first = fp_normalized.split()[0] if fp_normalized.split() else ""
-                sleeper_first = sleeper_normalized.split()[0] if sleeper_normalized.split() else ""
+                fp_first = normalized_fp.partition(" ")[0]
+                sleeper_first = chosen_key.partition(" ")[0]
                 
                 # Only proceed if first names are very similar or identical
                 if len(fp_first) > 0 and len(sleeper_first) > 0:
-                    first_name_similarity = fuzz.ratio(fp_first, sleeper_first)
-                    if first_name_similarity >= 85:  # First names must be very similar
-                        fantasypros_player.sleeper_id = candidates_map[chosen_key]
-                        matched_count += 1
-                        continue
+                    # Identical first names need no fuzzy score
+                    if fp_first == sleeper_first or fuzz.ratio(fp_first, sleeper_first, score_cutoff=FIRST_NAME_MATCH_CUTOFF) >= FIRST_NAME_MATCH_CUTOFF:
+                        fuzzy_matches[indices[row]] = candidates_map[chosen_key]
+        
+        unmatched_players = []
+        for index, (fantasypros_player, normalized_fp) in enumerate(pending):
+            if index in fuzzy_matches:
+                fantasypros_player.sleeper_id = fuzzy_matches[index]
+                matched_count += 1
+                continue
 
             # Fallback: try last-name + team + position heuristic (handles nicknames like "Hollywood Brown")
-            try:
-                last_name = self._normalize_name(fantasypros_player.name).split(" ")[-1]
-            except Exception:
-                last_name = ""
+            last_name = normalized_fp.split(" ")[-1]
             team = (fantasypros_player.team or "").upper()
             pos = (fantasypros_player.position or "").upper()
             fallback_candidates: List[str] = []
             if last_name and team and team != "FA" and pos:
-                for sp_id, sp in self.sleeper_players.items():
-                    sp_last = self._normalize_name(sp.get('last_name', ''))
-                    sp_team = (sp.get('team') or "").upper()
-                    sp_pos = (sp.get('position') or "").upper()
-                    if sp_last == last_name and sp_team == team and sp_pos == pos:
-                        fallback_candidates.append(sp_id)
+                fallback_candidates = fallback_index.get((last_name, team, pos), [])
             if len(fallback_candidates) == 1:
                 fantasypros_player.sleeper_id = fallback_candidates[0]
                 matched_count += 1
                 continue
             
             # If we get here, the player wasn't matched
-            unmatched_players.append(fantasypros_player)
+            unmatched_players.append((fantasypros_player, best_candidates.get(index)))
 
         print(f"Matched {matched_count} out of {len(self.players)} players")
         
         # Print unmatched players for debugging
-        if unmatched_players:
+        if unmatched_players and self.verbose:
             print(f"\nUnmatched players ({len(unmatched_players)}):")
-            for player in unmatched_players:
+            for player, best_match in unmatched_players:
                 print(f"  - {player.name} ({player.team}) - {player.position} - Overall Rank: {player.overall_rank}")
-                # Show some potential matches from Sleeper for debugging
-                normalized_fp = self._normalize_name(player.name)
-                candidates_map = position_map.get(player.position, {}) or normalized_map
-                candidate_keys = list(candidates_map.keys())
-                best_match = process.extractOne(
-                    normalized_fp,
-                    candidate_keys,
-                    scorer=fuzz.token_sort_ratio,
-                )
+                # Show the closest Sleeper candidate for debugging
                 if best_match:
-                    print(f"    Best fuzzy match: {best_match[0]} (score: {best_match[1]})")
+                    print(f"    Best fuzzy match: {best_match[0]} (score: {best_match[1]:.0f})")
                 print()
         # Re-apply drafted status if we already know drafted Sleeper IDs
         if self.drafted_sleeper_ids:
@@ -459,9 +817,9 @@ class FantasyDraftTool:
             if not username:
                 return None
             url = f"https://api.sleeper.app/v1/user/{username}"
-            resp = requests.get(url)
+            resp = _SESSION.get(url)
             resp.raise_for_status()
-            data = resp.json()
+            data = _json_body(resp)
             return data.get("user_id")
         except requests.RequestException as e:
             print(f"Error fetching user_id for username '{username}': {e}")
@@ -474,9 +832,9 @@ class FantasyDraftTool:
             if not user_id:
                 return []
             url = f"https://api.sleeper.app/v1/user/{user_id}/leagues/nfl/{season_year}"
-            resp = requests.get(url)
+            resp = _SESSION.get(url)
             resp.raise_for_status()
-            leagues = resp.json()
+            leagues = _json_body(resp)
             if isinstance(leagues, list):
                 return leagues
             return []
@@ -491,9 +849,9 @@ class FantasyDraftTool:
             if not league_id:
                 return []
             url = f"https://api.sleeper.app/v1/league/{league_id}/drafts"
-            resp = requests.get(url)
+            resp = _SESSION.get(url)
             resp.raise_for_status()
-            drafts = resp.json()
+            drafts = _json_body(resp)
             if isinstance(drafts, list):
                 return drafts
             return []
@@ -507,38 +865,34 @@ class FantasyDraftTool:
     @staticmethod
     def get_weekly_rankings_files() -> Dict[str, str]:
         """Get the latest weekly rankings files from the weekly_rankings folder."""
-        import os
-        import glob
-        
         rankings_dir = "weekly_rankings"
-        if not os.path.exists(rankings_dir):
-            return {}
         
         # Look for files matching the pattern: FantasyPros_2025_Week_X_TYPE_Rankings.csv
-        files = {}
-        
-        # Find OP (Offensive Players) file
-        op_files = glob.glob(f"{rankings_dir}/FantasyPros_*_Week_*_OP_Rankings.csv")
-        if op_files:
-            # Get the latest week (assuming you delete previous weeks)
-            files['OP'] = op_files[0]
-        
-        # Find DST file
-        dst_files = glob.glob(f"{rankings_dir}/FantasyPros_*_Week_*_DST_Rankings.csv")
-        if dst_files:
-            files['DST'] = dst_files[0]
-        
-        # Find K (Kicker) file
-        k_files = glob.glob(f"{rankings_dir}/FantasyPros_*_Week_*_K_Rankings.csv")
-        if k_files:
-            files['K'] = k_files[0]
-        
-        # Find ROS (Rest of Season) file
-        ros_files = glob.glob(f"{rankings_dir}/FantasyPros_*_Ros_ALL_Rankings.csv")
-        if ros_files:
-            files['ROS'] = ros_files[0]
+        # in a single directory pass
+        candidates: Dict[str, List[str]] = {}
+        try:
+            with os.scandir(rankings_dir) as entries:
+                for entry in entries:
+                    for position_type, pattern in _RANKINGS_FILE_PATTERNS.items():
+                        if fnmatch.fnmatchcase(entry.name, pattern):
+                            candidates.setdefault(position_type, []).append(entry.name)
+                            break
+        except OSError:
+            return {}
         
-        return files
+        # Prefer the latest season and week if older files were left behind
+        return {
+            position_type: os.path.join(rankings_dir, max(names, key=_rankings_file_order))
+            for position_type, names in candidates.items()
+        }
+
+    @staticmethod
+    def get_weekly_rankings_files_key() -> tuple:
+        """Identify the current rankings files by path and modification time, as a cache key."""
+        return tuple(sorted(
+            (position_type, path, os.path.getmtime(path))
+            for position_type, path in FantasyDraftTool.get_weekly_rankings_files().items()
+        ))
 
     @staticmethod
     def load_weekly_rankings() -> Dict[str, List[Dict]]:
@@ -577,17 +931,32 @@ class FantasyDraftTool:
         
         try:
             with open(ros_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+                reader = csv.reader(f)
+                header = next(reader, [])
+                # Parse ROS CSV format: "RK","PLAYER NAME",TEAM,"POS","SOS SEASON","SOS PLAYOFFS","ECR VS. ADP"
+                columns = {name: i for i, name in enumerate(header)}
+                missing = [name for name in ('RK', 'PLAYER NAME', 'TEAM', 'POS') if name not in columns]
+                if missing:
+                    print(f"ROS rankings file is missing columns: {missing}")
+                    return []
+                i_rank = columns['RK']
+                i_name = columns['PLAYER NAME']
+                i_team = columns['TEAM']
+                i_pos = columns['POS']
+                
                 for row in reader:
+                    if not row:
+                        continue
+                    # Pad short rows so missing trailing fields read as empty
+                    row += [''] * (len(header) - len(row))
                     try:
-                        # Parse ROS CSV format: "RK","PLAYER NAME",TEAM,"POS","SOS SEASON","SOS PLAYOFFS","ECR VS. ADP"
-                        rank = int(row['RK'].strip('"'))
-                        name = row['PLAYER NAME'].strip('"')
-                        team = row['TEAM'].strip('"')
-                        position = row['POS'].strip('"')
+                        rank = int(row[i_rank].strip('"'))
+                        name = row[i_name].strip('"')
+                        team = row[i_team].strip('"')
+                        position = row[i_pos].strip('"')
                         
                         # Extract base position (e.g., "WR" from "WR1")
-                        pos_match = re.match(r'([A-Z]+)', position)
+                        pos_match = _RE_POS_PREFIX.match(position)
                         base_position = pos_match.group(1) if pos_match else position
                         
                         player = {
@@ -599,8 +968,8 @@ class FantasyDraftTool:
                         }
                         ros_players.append(player)
                         
-                    except (ValueError, KeyError) as e:
-                        print(f"Error parsing ROS player row: {e}")
+                    except ValueError as e:
+                        logger.warning("Error parsing ROS player row: %s", e)
                         continue
                         
         except Exception as e:
@@ -610,14 +979,48 @@ class FantasyDraftTool:
         return ros_players
     
     @staticmethod
-    def analyze_ros_recommendations(user_players_list: List[Dict], sleeper_players: Dict[str, dict], 
-                                   all_league_players: List[Dict], ros_rankings: List[Dict]) -> Dict:
+    def _name_match_matrix(queries: List[str], choices: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Score normalized query names against normalized choice names in one pass.
+
+        Returns the full-name score matrix and a boolean matrix marking the pairs
+        whose full names and first names both clear the match cutoffs. Empty
+        names never match.
+        """
+        scores = process.cdist(queries, choices, scorer=fuzz.ratio, processor=None,
+                               score_cutoff=NAME_MATCH_CUTOFF, workers=-1)
+        first_scores = process.cdist(
+            [name.partition(" ")[0] for name in queries],
+            [name.partition(" ")[0] for name in choices],
+            scorer=fuzz.ratio, processor=None,
+            score_cutoff=FIRST_NAME_MATCH_CUTOFF, workers=-1,
+        )
+        matches = (scores >= NAME_MATCH_CUTOFF) & (first_scores >= FIRST_NAME_MATCH_CUTOFF)
+        matches &= np.array([bool(name) for name in queries], dtype=bool)[:, None]
+        matches &= np.array([bool(name) for name in choices], dtype=bool)[None, :]
+        return scores, matches
+
+    @staticmethod
+    def analyze_ros_recommendations(user_players_list: List[str], sleeper_players: Dict[str, dict], 
+                                   all_league_players: List[str], ros_rankings: List[Dict]) -> Dict:
         """Analyze ROS rankings and provide upgrade recommendations."""
         
-        # Match user's players with ROS rankings
-        user_ros_players = []
-        for user_player in user_players_list:
-            player_id = user_player['player_id']
+        # Normalized ROS names grouped by position, built once for all lookups
+        ros_names_by_position: Dict[str, List[str]] = {}
+        ros_players_by_position: Dict[str, List[Dict]] = {}
+        ros_rows_by_position: Dict[str, List[int]] = {}
+        for ros_index, ros_player in enumerate(ros_rankings):
+            position = ros_player['position']
+            ros_names_by_position.setdefault(position, []).append(
+                FantasyDraftTool._normalize_name(ros_player['name'])
+            )
+            ros_players_by_position.setdefault(position, []).append(ros_player)
+            ros_rows_by_position.setdefault(position, []).append(ros_index)
+        
+        # Collect user's players by position (DST and K are handled elsewhere)
+        user_entries = []
+        user_names_by_position: Dict[str, List[str]] = {}
+        user_rows_by_position: Dict[str, List[int]] = {}
+        for player_id in FantasyDraftTool._player_ids(user_players_list):
             sleeper_player = sleeper_players.get(player_id)
             
             if not sleeper_player:
@@ -626,33 +1029,31 @@ class FantasyDraftTool:
             sleeper_name = sleeper_player.get('full_name', '').strip()
             sleeper_position = sleeper_player.get('position', '').strip()
             
-            # Skip DST and K since they're handled elsewhere
-            if sleeper_position in ['DEF', 'K']:
+            if sleeper_position in _SPECIAL_TEAMS_POSITIONS:
                 continue
             
-            # Match with ROS rankings using fuzzy matching
-            best_match = None
-            best_score = 0
-            
-            normalized_sleeper_name = FantasyDraftTool._normalize_name(sleeper_name)
-            
-            for ros_player in ros_rankings:
-                if ros_player['position'] != sleeper_position:
-                    continue
-                    
-                normalized_ros_name = FantasyDraftTool._normalize_name(ros_player['name'])
-                score = fuzz.ratio(normalized_sleeper_name, normalized_ros_name)
-                
-                if score >= 95:  # High threshold to avoid mismatches
-                    # Additional validation: check first name similarity
-                    sleeper_first = normalized_sleeper_name.split()[0] if normalized_sleeper_name.split() else ""
-                    ros_first = normalized_ros_name.split()[0] if normalized_ros_name.split() else ""
-                    first_name_score = fuzz.ratio(sleeper_first, ros_first)
-                    
-                    if first_name_score >= 85 and score > best_score:
-                        best_score = score
-                        best_match = ros_player
-            
+            user_rows_by_position.setdefault(sleeper_position, []).append(len(user_entries))
+            user_names_by_position.setdefault(sleeper_position, []).append(
+                FantasyDraftTool._normalize_name(sleeper_name)
+            )
+            user_entries.append(player_id)
+        
+        # Match user's players with ROS rankings, scoring a whole position at once
+        best_matches: Dict[int, Dict] = {}
+        for position, user_names in user_names_by_position.items():
+            ros_names = ros_names_by_position.get(position, [])
+            if not ros_names:
+                continue
+            scores, matches = FantasyDraftTool._name_match_matrix(user_names, ros_names)
+            # Best passing score per user player; argmax keeps the first on ties
+            best_scores = np.where(matches, scores, -1)
+            for row, ros_index in enumerate(best_scores.argmax(axis=1)):
+                if matches[row, ros_index]:
+                    best_matches[user_rows_by_position[position][row]] = ros_players_by_position[position][ros_index]
+        
+        user_ros_players = []
+        for entry_index, player_id in enumerate(user_entries):
+            best_match = best_matches.get(entry_index)
             if best_match:
                 user_ros_players.append({
                     'player_id': player_id,
@@ -664,38 +1065,32 @@ class FantasyDraftTool:
                 })
         
         # Get all players owned by other teams (to exclude from free agents)
-        owned_player_ids = set()
-        for roster_player in all_league_players:
-            owned_player_ids.add(roster_player['player_id'])
+        owned_player_ids = set(FantasyDraftTool._player_ids(all_league_players))
+        
+        # Normalized Sleeper names by position, shared across calls on the same dump
+        name_index = _sleeper_name_index(sleeper_players)
+        
+        # Find the Sleeper ID for each ROS player: the first Sleeper player
+        # (in dump order) whose name passes the match checks
+        found_sleeper_ids: Dict[int, str] = {}
+        for position, ros_names in ros_names_by_position.items():
+            sleeper_names = name_index.position_full_names.get(position)
+            if not sleeper_names or position in _SPECIAL_TEAMS_POSITIONS:
+                continue
+            _, matches = FantasyDraftTool._name_match_matrix(ros_names, sleeper_names)
+            first_match = matches.argmax(axis=1)
+            for row, sleeper_index in enumerate(first_match):
+                if matches[row, sleeper_index]:
+                    found_sleeper_ids[ros_rows_by_position[position][row]] = name_index.position_ids[position][sleeper_index]
         
         # Find free agents (players not owned by any team) with ROS rankings
         free_agents = []
-        for ros_player in ros_rankings:
+        for ros_index, ros_player in enumerate(ros_rankings):
             # Skip DST and K
-            if ros_player['position'] in ['DEF', 'K']:
+            if ros_player['position'] in _SPECIAL_TEAMS_POSITIONS:
                 continue
                 
-            # Find sleeper player ID for this ROS player
-            found_sleeper_id = None
-            normalized_ros_name = FantasyDraftTool._normalize_name(ros_player['name'])
-            
-            for sleeper_id, sleeper_player in sleeper_players.items():
-                if sleeper_player.get('position') != ros_player['position']:
-                    continue
-                    
-                sleeper_name = sleeper_player.get('full_name', '').strip()
-                normalized_sleeper_name = FantasyDraftTool._normalize_name(sleeper_name)
-                
-                score = fuzz.ratio(normalized_sleeper_name, normalized_ros_name)
-                if score >= 95:
-                    # Additional validation: check first name similarity
-                    sleeper_first = normalized_sleeper_name.split()[0] if normalized_sleeper_name.split() else ""
-                    ros_first = normalized_ros_name.split()[0] if normalized_ros_name.split() else ""
-                    first_name_score = fuzz.ratio(sleeper_first, ros_first)
-                    
-                    if first_name_score >= 85:
-                        found_sleeper_id = sleeper_id
-                        break
+            found_sleeper_id = found_sleeper_ids.get(ros_index)
             
             # If player found and not owned by any team, add to free agents
             if found_sleeper_id and found_sleeper_id not in owned_player_ids:
@@ -742,14 +1137,11 @@ class FantasyDraftTool:
         worst_drops = []
         
         if user_ros_players and free_agents:
-            # Sort both lists by rank
-            sorted_free_agents = sorted(free_agents, key=lambda x: x['rank'])
-            sorted_user_players = sorted(user_ros_players, key=lambda x: x['rank'], reverse=True)
-            
-            # Find beneficial swaps: free agents better than user's worst players
-            for i in range(min(len(sorted_free_agents), len(sorted_user_players))):
-                free_agent = sorted_free_agents[i]
-                user_player = sorted_user_players[i]
+            # Both lists are already sorted by rank: walk free agents from the best
+            # and user players from the worst
+            for i in range(min(len(free_agents), len(user_ros_players))):
+                free_agent = free_agents[i]
+                user_player = user_ros_players[-1 - i]
                 
                 # Only add if free agent is actually better (lower rank number)
                 if free_agent['rank'] < user_player['rank']:
@@ -774,31 +1166,27 @@ class FantasyDraftTool:
             if not league_id:
                 return []
             url = f"https://api.sleeper.app/v1/league/{league_id}/rosters"
-            resp = requests.get(url)
-            resp.raise_for_status()
-            rosters = resp.json()
+            rosters = _get_json_revalidated(url)
             if isinstance(rosters, list):
-                # Validate roster structure and add debugging for chopped leagues
-                validated_rosters = []
-                for i, roster in enumerate(rosters):
-                    if not isinstance(roster, dict):
-                        print(f"Warning: Roster {i} is not a dictionary: {type(roster)}")
-                        continue
-                    
-                    # Check if players field exists and is valid
+                # Validate roster structure (chopped leagues can return odd shapes)
+                validated_rosters = [roster for roster in rosters if isinstance(roster, dict)]
+                if len(validated_rosters) != len(rosters):
+                    logger.debug("Skipped %d non-dictionary rosters", len(rosters) - len(validated_rosters))
+                
+                for roster in validated_rosters:
                     players = roster.get('players')
-                    if players is not None and not isinstance(players, list):
-                        print(f"Warning: Roster {i} has invalid players field: {type(players)}")
-                        # Try to convert to list if possible
-                        try:
-                            roster['players'] = list(players) if players else []
-                        except (TypeError, ValueError):
-                            print(f"Could not convert players field to list for roster {i}")
-                            roster['players'] = []
-                    elif players is None:
+                    if isinstance(players, list):
+                        continue
+                    if players is None:
+                        roster['players'] = []
+                        continue
+                    logger.debug("Roster has invalid players field: %s", type(players))
+                    # Try to convert to list if possible
+                    try:
+                        roster['players'] = list(players) if players else []
+                    except (TypeError, ValueError):
+                        logger.debug("Could not convert players field to list")
                         roster['players'] = []
-                    
-                    validated_rosters.append(roster)
                 
                 return validated_rosters
             return []
@@ -813,9 +1201,7 @@ class FantasyDraftTool:
             if not league_id:
                 return []
             url = f"https://api.sleeper.app/v1/league/{league_id}/users"
-            resp = requests.get(url)
-            resp.raise_for_status()
-            users = resp.json()
+            users = _get_json_revalidated(url)
             if isinstance(users, list):
                 return users
             return []
@@ -823,27 +1209,209 @@ class FantasyDraftTool:
             print(f"Error fetching users for league_id '{league_id}': {e}")
             return []
 
+    @staticmethod
+    def fetch_league_bundle(league_id: str) -> Dict[str, List[dict]]:
+        """Fetch a league's rosters and users concurrently.
+
+        Returns {'rosters': [...], 'users': [...]}, with the same fallbacks as
+        fetch_league_rosters() and fetch_league_users().
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            rosters = executor.submit(FantasyDraftTool.fetch_league_rosters, league_id)
+            users = executor.submit(FantasyDraftTool.fetch_league_users, league_id)
+            return {'rosters': rosters.result(), 'users': users.result()}
+
+    @staticmethod
+    def collect_league_player_ids(rosters: List[dict]) -> List[str]:
+        """Get the IDs of every player on any roster in the league."""
+        return [
+            player_id
+            for roster in rosters if isinstance(roster, dict)
+            for player_id in (roster.get('players') or []) if player_id
+        ]
+
+    @staticmethod
+    def _player_ids(players: List) -> List[str]:
+        """Accept player IDs or legacy {'player_id': ...} dicts and return IDs."""
+        return [p.get('player_id') if isinstance(p, dict) else p for p in players]
+
+    @staticmethod
+    def _roster_name_lookup(roster: List[Tuple[str, dict]]) -> Tuple[Dict[str, Tuple[str, dict]], Dict[str, Tuple[str, dict]]]:
+        """Index (player_id, sleeper_player) pairs by exact and normalized full name.
+
+        The first roster entry for a normalized name wins, and only that entry is
+        indexed by its exact name, so probing exact then normalized finds the same
+        player as scanning the roster in order.
+        """
+        by_normalized = {}
+        for player_id, sleeper_player in roster:
+            normalized = FantasyDraftTool._normalize_name(sleeper_player.get('full_name', ''))
+            by_normalized.setdefault(normalized, (player_id, sleeper_player))
+        by_exact = {entry[1].get('full_name', ''): entry for entry in by_normalized.values()}
+        return by_exact, by_normalized
+
+    @staticmethod
+    def _fill_flex_slots(bench: List[Dict], position_requirements: Dict[str, int]) -> Tuple[List[Tuple[str, Dict]], List[Dict]]:
+        """Assign the best-ranked eligible bench players to the flex slots.
+
+        bench must already be sorted by rank. Returns the (slot, player) picks in
+        fill order and the players left on the bench, in their original order.
+        """
+        # Partition the bench in one pass; each list inherits the bench's rank order
+        eligible = {slot: [] for slot in _FLEX_SLOT_POSITIONS}
+        for player in bench:
+            pos = player['position']
+            for slot, positions in _FLEX_SLOT_POSITIONS.items():
+                if pos in positions:
+                    eligible[slot].append(player)
+        picked = set()  # id() of players already moved into a flex slot
+        picks = []
+        for slot, candidates in eligible.items():
+            next_idx = 0
+            for _ in range(position_requirements.get(slot, 0)):
+                while next_idx < len(candidates) and id(candidates[next_idx]) in picked:
+                    next_idx += 1
+                if next_idx == len(candidates):
+                    break
+                player = candidates[next_idx]
+                picked.add(id(player))
+                picks.append((slot, player))
+        
+        remaining = [p for p in bench if id(p) not in picked] if picked else bench
+        return picks, remaining
+
+    @staticmethod
+    def _pair_upgrades(added_players: List[Dict], dropped_players: List[Dict]) -> List[Dict]:
+        """Pair each added free agent with the worst-ranked starter it can replace.
+
+        A starter can be replaced by a player of the same position, or across RB,
+        WR and TE when either player fills a flex slot. Dropped starters are kept
+        in heaps keyed by (worst rank, lineup order) so each pick is a heap pop;
+        DEF and K starters are never paired.
+        """
+        by_position: Dict[str, list] = {}
+        flex_eligible = []   # all RB/WR/TE drops
+        flex_slotted = []    # RB/WR/TE drops that were in a flex slot
+        for order, dropped_player in enumerate(dropped_players):
+            position = dropped_player['position']
+            if position in _SPECIAL_TEAMS_POSITIONS:
+                continue
+            entry = (-dropped_player['rank'], order, dropped_player)
+            by_position.setdefault(position, []).append(entry)
+            if position in _FLEX_ELIGIBLE:
+                flex_eligible.append(entry)
+                if dropped_player.get('flex_slot'):
+                    flex_slotted.append(entry)
+        for heap in (*by_position.values(), flex_eligible, flex_slotted):
+            heapq.heapify(heap)
+        
+        paired = set()  # lineup order of drops already used
+        upgrades = []
+        for added_player in added_players:
+            if not added_player.get('is_free_agent', False):
+                continue
+            
+            # Candidate heaps: same position, plus cross-position flex replacements
+            heaps = [by_position.get(added_player['position'], [])]
+            if added_player['position'] in _FLEX_ELIGIBLE:
+                heaps.append(flex_eligible if added_player.get('flex_slot') else flex_slotted)
+            
+            best = None
+            for heap in heaps:
+                while heap and heap[0][1] in paired:
+                    heapq.heappop(heap)
+                if heap and (best is None or heap[0][:2] < best[:2]):
+                    best = heap[0]
+            if best is None:
+                continue
+            
+            best_improvement = -best[0] - added_player['rank']
+            if best_improvement > 0:
+                best_match = best[2]
+                paired.add(best[1])
+                added_player['replaces_player'] = best_match
+                upgrades.append({
+                    'position': added_player['position'],
+                    'drop': best_match,
+                    'add': added_player,
+                    'improvement': best_improvement
+                })
+        return upgrades
+
+    @staticmethod
+    def _ranking_rows(rankings: List[Dict], field: str):
+        """Yield (rank_idx, player_name, field_value) for usable weekly ranking rows.
+
+        Rows that are not dictionaries, are empty or have no player name are
+        skipped; rank_idx is the row's 0-based position in the original list.
+        """
+        for rank_idx, ranking in enumerate(rankings):
+            if not isinstance(ranking, dict) or not ranking:
+                continue
+            player_name = ranking.get('PLAYER NAME', '').strip()
+            if player_name:
+                yield rank_idx, player_name, ranking.get(field, '').strip()
+
     # ------------------------------
     # Weekly Rankings Analysis
     # ------------------------------
     @staticmethod
-    def analyze_weekly_rankings(weekly_rankings: Dict[str, List[Dict]], user_players: List[dict], sleeper_players: Dict[str, dict], roster_settings: Dict, all_league_players: List[dict] = None) -> Dict:
-        """Analyze weekly rankings and provide start/sit recommendations based on rankings and roster requirements."""
+    def analyze_weekly_rankings(weekly_rankings: Dict[str, List[Dict]], user_players: List[str], sleeper_players: Dict[str, dict], roster_settings: Dict, all_league_players: List[str] = None,
+                                need_defenses: bool = True, need_kickers: bool = True) -> Dict:
+        """Analyze weekly rankings and provide start/sit recommendations based on rankings and roster requirements.
+
+        Pass need_defenses / need_kickers as False for leagues without DEF / K
+        slots to skip matching those rankings; the lists come back empty.
+        """
         # Validate inputs
         if not isinstance(weekly_rankings, dict):
-            print("Warning: weekly_rankings is not a dictionary")
+            logger.warning("weekly_rankings is not a dictionary")
             weekly_rankings = {}
         if not isinstance(user_players, list):
-            print("Warning: user_players is not a list")
+            logger.warning("user_players is not a list")
             user_players = []
         if not isinstance(sleeper_players, dict):
-            print("Warning: sleeper_players is not a dictionary")
+            logger.warning("sleeper_players is not a dictionary")
             sleeper_players = {}
         if not isinstance(roster_settings, dict):
-            print("Warning: roster_settings is not a dictionary")
+            logger.warning("roster_settings is not a dictionary")
             roster_settings = {}
         if all_league_players is None:
             all_league_players = []
+        user_players = FantasyDraftTool._player_ids(user_players)
+        all_league_players = FantasyDraftTool._player_ids(all_league_players)
+        
+        # Resolve the user's roster against Sleeper once for every rankings section
+        roster = [
+            (user_player_id, sleeper_players[user_player_id])
+            for user_player_id in user_players
+            if sleeper_players.get(user_player_id)
+        ]
+        roster_defenses = [(pid, sp) for pid, sp in roster if sp.get('position') == 'DEF']
+        roster_kickers = [(pid, sp) for pid, sp in roster if sp.get('position') == 'K']
+        # Candidate list for fuzzy matching offensive players
+        roster_candidates = [(sp.get('full_name', ''), pid) for pid, sp in roster if sp.get('full_name', '')]
+        candidate_names = [name for name, _ in roster_candidates]
+        exact_by_name, norm_by_name = FantasyDraftTool._roster_name_lookup(roster)
+        kicker_exact_by_name, kicker_norm_by_name = FantasyDraftTool._roster_name_lookup(roster_kickers)
+        
+        # Defenses and kickers owned anywhere in the league, for waiver availability
+        owned_def_teams = set()
+        owned_def_names = set()
+        owned_k_names = set()
+        owned_k_normalized_names = set()
+        for league_player_id in all_league_players:
+            sleeper_player = sleeper_players.get(league_player_id)
+            if not sleeper_player:
+                continue
+            position = sleeper_player.get('position')
+            if position == 'DEF':
+                owned_def_teams.add(sleeper_player.get('team', ''))
+                owned_def_names.add(sleeper_player.get('full_name', ''))
+            elif position == 'K':
+                sleeper_name = sleeper_player.get('full_name', '')
+                owned_k_names.add(sleeper_name)
+                owned_k_normalized_names.add(FantasyDraftTool._normalize_name(sleeper_name))
             
         analysis = {
             'starters': [],
@@ -858,184 +1426,127 @@ class FantasyDraftTool:
         
         # Process offensive players (QB, RB, WR, TE) and create ranked list
         user_offensive_players = []
+        # Rows without an exact match, fuzzy matched together after the scan
+        fuzzy_pending = []
         if 'OP' in weekly_rankings:
             op_rankings = weekly_rankings['OP']
             
-            for rank_idx, ranking in enumerate(op_rankings):
-                # Skip if ranking is not a dictionary or is empty
-                if not isinstance(ranking, dict) or not ranking:
-                    continue
-                    
-                player_name = ranking.get('PLAYER NAME', '').strip()
-                position_with_rank = ranking.get('POS', '').strip()
-                
+            for rank_idx, player_name, position_with_rank in FantasyDraftTool._ranking_rows(op_rankings, 'POS'):
                 # Skip if essential data is missing
-                if not player_name or not position_with_rank:
+                if not position_with_rank:
                     continue
                 
                 # Extract base position from position with rank (e.g., "WR2" -> "WR", "QB9" -> "QB")
-                base_position = position_with_rank
-                if position_with_rank and position_with_rank[0].isalpha():
-                    # Find where the position ends and rank begins
-                    for i, char in enumerate(position_with_rank):
-                        if char.isdigit():
-                            base_position = position_with_rank[:i]
-                            break
+                base_position = _base_position(position_with_rank)
                 
                 # Find matching player in user's roster using fuzzy matching
                 matched = False
-                for user_player in user_players:
-                    sleeper_player = sleeper_players.get(user_player.get('player_id', ''))
-                    if sleeper_player:
-                        sleeper_name = sleeper_player.get('full_name', '')
-                        
-                        # Try exact match first
-                        if sleeper_name == player_name:
-                            user_offensive_players.append({
-                                'name': player_name,
-                                'position': base_position,  # Use base position for roster logic
-                                'position_with_rank': position_with_rank,  # Keep original for display
-                                'rank': rank_idx + 1,  # 1-based ranking
-                                'team': sleeper_player.get('team', ''),
-                                'sleeper_id': user_player.get('player_id'),
-                                'is_on_roster': True
-                            })
-                            matched = True
-                            break
-                        
-                        # Try normalized exact match
-                        normalized_fp = FantasyDraftTool._normalize_name(player_name)
-                        normalized_sleeper = FantasyDraftTool._normalize_name(sleeper_name)
-                        if normalized_fp == normalized_sleeper:
-                            user_offensive_players.append({
-                                'name': player_name,
-                                'position': base_position,
-                                'position_with_rank': position_with_rank,
-                                'rank': rank_idx + 1,
-                                'team': sleeper_player.get('team', ''),
-                                'sleeper_id': user_player.get('player_id'),
-                                'is_on_roster': True
-                            })
-                            matched = True
-                            break
+                # Try exact match first, then normalized exact match
+                exact_match = exact_by_name.get(player_name)
+                if exact_match is None:
+                    exact_match = norm_by_name.get(FantasyDraftTool._normalize_name(player_name))
+                if exact_match is not None:
+                    user_player_id, sleeper_player = exact_match
+                    user_offensive_players.append({
+                        'name': player_name,
+                        'position': base_position,  # Use base position for roster logic
+                        'position_with_rank': position_with_rank,  # Keep original for display
+                        'rank': rank_idx + 1,  # 1-based ranking
+                        'team': sleeper_player.get('team', ''),
+                        'sleeper_id': user_player_id,
+                        'is_on_roster': True
+                    })
+                    matched = True
                 
                 # If no exact match found, try fuzzy matching
-                if not matched:
-                    # Build candidate list from user's roster
-                    roster_candidates = []
-                    for user_player in user_players:
-                        sleeper_player = sleeper_players.get(user_player.get('player_id', ''))
-                        if sleeper_player:
-                            sleeper_name = sleeper_player.get('full_name', '')
-                            if sleeper_name:
-                                roster_candidates.append((sleeper_name, user_player.get('player_id')))
-                    
-                    if roster_candidates:
-                        # Try fuzzy matching
-                        candidate_names = [name for name, _ in roster_candidates]
-                        best_match = process.extractOne(
-                            player_name,
-                            candidate_names,
-                            scorer=fuzz.token_sort_ratio,
-                        )
-                        
-                        if best_match and best_match[1] >= 95:  # Very high confidence threshold
-                            matched_name = best_match[0]
-                            
-                            # Additional validation: check for common name confusions
-                            fp_normalized = FantasyDraftTool._normalize_name(player_name).lower()
-                            sleeper_normalized = FantasyDraftTool._normalize_name(matched_name).lower()
-                            
-                            # Reject matches if first names are completely different
-                            fp_first = fp_normalized.split()[0] if fp_normalized.split() else ""
-                            sleeper_first = sleeper_normalized.split()[0] if sleeper_normalized.split() else ""
-                            
-                            # Only proceed if first names are very similar or identical
-                            if len(fp_first) > 0 and len(sleeper_first) > 0:
-                                first_name_similarity = fuzz.ratio(fp_first, sleeper_first)
-                                if first_name_similarity >= 85:  # First names must be very similar
-                                    # Find the corresponding player_id
-                                    for name, player_id in roster_candidates:
-                                        if name == matched_name:
-                                            sleeper_player = sleeper_players.get(player_id)
-                                            user_offensive_players.append({
-                                                'name': player_name,
-                                                'position': base_position,
-                                                'position_with_rank': position_with_rank,
-                                                'rank': rank_idx + 1,
-                                                'team': sleeper_player.get('team', ''),
-                                                'sleeper_id': player_id,
-                                                'is_on_roster': True
-                                            })
-                                            break
+                if not matched and roster_candidates:
+                    fuzzy_pending.append((rank_idx, player_name, base_position, position_with_rank))
+        
+        if fuzzy_pending:
+            # Score every unmatched row against the roster in one call; argmax keeps
+            # the first best candidate, as extractOne did
+            scores = process.cdist(
+                [row[1] for row in fuzzy_pending],
+                candidate_names,
+                scorer=fuzz.token_sort_ratio,
+                processor=utils.default_process,
+            )
+            best_indices = scores.argmax(axis=1)
+            for (rank_idx, player_name, base_position, position_with_rank), best_idx, row_scores in zip(
+                fuzzy_pending, best_indices, scores
+            ):
+                if row_scores[best_idx] < NAME_MATCH_CUTOFF:  # Very high confidence threshold
+                    continue
+                matched_name, player_id = roster_candidates[best_idx]
+                
+                # Additional validation: check for common name confusions
+                fp_normalized = FantasyDraftTool._normalize_name(player_name).lower()
+                sleeper_normalized = FantasyDraftTool._normalize_name(matched_name).lower()
+                
+                # Reject matches if first names are completely different
+                fp_first = fp_normalized.partition(" ")[0]
+                sleeper_first = sleeper_normalized.partition(" ")[0]
+                
+                # Only proceed if first names are very similar or identical
+                if len(fp_first) > 0 and len(sleeper_first) > 0:
+                    # Identical first names need no fuzzy score
+                    if fp_first == sleeper_first or fuzz.ratio(fp_first, sleeper_first, score_cutoff=FIRST_NAME_MATCH_CUTOFF) >= FIRST_NAME_MATCH_CUTOFF:
+                        sleeper_player = sleeper_players.get(player_id)
+                        user_offensive_players.append({
+                            'name': player_name,
+                            'position': base_position,
+                            'position_with_rank': position_with_rank,
+                            'rank': rank_idx + 1,
+                            'team': sleeper_player.get('team', ''),
+                            'sleeper_id': player_id,
+                            'is_on_roster': True
+                        })
         
         # Sort by rank (ascending - lower rank number is better)
         user_offensive_players.sort(key=lambda x: x['rank'])
         
-        print(f"Found {len(user_offensive_players)} matching players after fuzzy matching")
+        logger.info("Found %d matching players after fuzzy matching", len(user_offensive_players))
         
         # Process defenses FIRST
-        if 'DST' in weekly_rankings:
+        if need_defenses and 'DST' in weekly_rankings:
             dst_rankings = weekly_rankings['DST']
-            print(f"Processing {len(dst_rankings)} defenses from weekly rankings...")
+            logger.debug("Processing %d defenses from weekly rankings...", len(dst_rankings))
             
-            for rank_idx, ranking in enumerate(dst_rankings):
-                # Skip if ranking is not a dictionary or is empty
-                if not isinstance(ranking, dict) or not ranking:
-                    continue
-                    
-                team_name = ranking.get('PLAYER NAME', '').strip()
-                team_abbrev = ranking.get('TEAM', '').strip()
-                
-                # Skip if essential data is missing
-                if not team_name:
-                    continue
-                
+            for rank_idx, team_name, team_abbrev in FantasyDraftTool._ranking_rows(dst_rankings, 'TEAM'):
                 # Check if user has this defense
                 is_on_roster = False
-                for user_player in user_players:
-                    sleeper_player = sleeper_players.get(user_player.get('player_id', ''))
-                    if sleeper_player and sleeper_player.get('position') == 'DEF':
-                        sleeper_team = sleeper_player.get('team', '')
-                        sleeper_name = sleeper_player.get('full_name', '')
+                for user_player_id, sleeper_player in roster_defenses:
+                    sleeper_team = sleeper_player.get('team', '')
+                    sleeper_name = sleeper_player.get('full_name', '')
+                    
+                    # Try multiple matching strategies
+                    if (sleeper_team == team_abbrev or 
+                        sleeper_team == team_name or 
+                        sleeper_name == team_name or
+                        team_abbrev in sleeper_name or
+                        team_name in sleeper_name):
                         
-                        # Try multiple matching strategies
-                        if (sleeper_team == team_abbrev or 
-                            sleeper_team == team_name or 
-                            sleeper_name == team_name or
-                            team_abbrev in sleeper_name or
-                            team_name in sleeper_name):
-                            
-                            analysis['defenses'].append({
-                                'name': team_name,
-                                'rank': rank_idx + 1,
-                                'team': team_abbrev,
-                                'sleeper_id': user_player.get('player_id'),
-                                'is_on_roster': True
-                            })
-                            print(f"Matched defense: {team_name} ({team_abbrev}) - Rank #{rank_idx + 1}")
-                            is_on_roster = True
-                            break
+                        analysis['defenses'].append({
+                            'name': team_name,
+                            'rank': rank_idx + 1,
+                            'team': team_abbrev,
+                            'sleeper_id': user_player_id,
+                            'is_on_roster': True
+                        })
+                        logger.debug("Matched defense: %s (%s) - Rank #%d", team_name, team_abbrev, rank_idx + 1)
+                        is_on_roster = True
+                        break
                 
                 # If not on roster, check if it's available (not owned by any team in the league)
                 if not is_on_roster:
                     # Check if this defense is owned by any team in the league
-                    is_available = True
-                    if all_league_players:
-                        for league_player in all_league_players:
-                            sleeper_player = sleeper_players.get(league_player.get('player_id', ''))
-                            if sleeper_player and sleeper_player.get('position') == 'DEF':
-                                sleeper_team = sleeper_player.get('team', '')
-                                sleeper_name = sleeper_player.get('full_name', '')
-                                
-                                # Check if this is the same defense
-                                if (sleeper_team == team_abbrev or 
-                                    sleeper_team == team_name or 
-                                    sleeper_name == team_name or
-                                    team_abbrev in sleeper_name or
-                                    team_name in sleeper_name):
-                                    is_available = False
-                                    break
+                    is_available = not (
+                        team_abbrev in owned_def_teams or
+                        team_name in owned_def_teams or
+                        team_name in owned_def_names or
+                        any(team_abbrev in sleeper_name or team_name in sleeper_name
+                            for sleeper_name in owned_def_names)
+                    )
                     
                     if is_available:
                         analysis['waiver_suggestions']['defenses'].append({
@@ -1045,75 +1556,41 @@ class FantasyDraftTool:
                             'is_on_roster': False
                         })
             
-            print(f"Found {len(analysis['defenses'])} defenses on roster")
+            logger.debug("Found %d defenses on roster", len(analysis['defenses']))
         
         # Process kickers FIRST
-        if 'K' in weekly_rankings:
+        if need_kickers and 'K' in weekly_rankings:
             k_rankings = weekly_rankings['K']
-            print(f"Processing {len(k_rankings)} kickers from weekly rankings...")
+            logger.debug("Processing %d kickers from weekly rankings...", len(k_rankings))
             
-            for rank_idx, ranking in enumerate(k_rankings):
-                # Skip if ranking is not a dictionary or is empty
-                if not isinstance(ranking, dict) or not ranking:
-                    continue
-                    
-                player_name = ranking.get('PLAYER NAME', '').strip()
-                team_abbrev = ranking.get('TEAM', '').strip()
-                
-                # Skip if essential data is missing
-                if not player_name:
-                    continue
-                
+            for rank_idx, player_name, team_abbrev in FantasyDraftTool._ranking_rows(k_rankings, 'TEAM'):
                 # Check if user has this kicker using fuzzy matching
                 is_on_roster = False
-                for user_player in user_players:
-                    sleeper_player = sleeper_players.get(user_player.get('player_id', ''))
-                    if sleeper_player and sleeper_player.get('position') == 'K':
-                        sleeper_name = sleeper_player.get('full_name', '')
-                        
-                        # Try exact match first
-                        if sleeper_name == player_name:
-                            analysis['kickers'].append({
-                                'name': player_name,
-                                'rank': rank_idx + 1,
-                                'team': sleeper_player.get('team', ''),
-                                'sleeper_id': user_player.get('player_id'),
-                                'is_on_roster': True
-                            })
-                            print(f"Matched kicker: {player_name} - Rank #{rank_idx + 1}")
-                            is_on_roster = True
-                            break
-                        
-                        # Try normalized match
-                        normalized_fp = FantasyDraftTool._normalize_name(player_name)
-                        normalized_sleeper = FantasyDraftTool._normalize_name(sleeper_name)
-                        if normalized_fp == normalized_sleeper:
-                            analysis['kickers'].append({
-                                'name': player_name,
-                                'rank': rank_idx + 1,
-                                'team': sleeper_player.get('team', ''),
-                                'sleeper_id': user_player.get('player_id'),
-                                'is_on_roster': True
-                            })
-                            print(f"Matched kicker (normalized): {player_name} - Rank #{rank_idx + 1}")
-                            is_on_roster = True
-                            break
+                # Try exact match first, then normalized match
+                kicker_match = kicker_exact_by_name.get(player_name)
+                match_label = "Matched kicker"
+                if kicker_match is None:
+                    kicker_match = kicker_norm_by_name.get(FantasyDraftTool._normalize_name(player_name))
+                    match_label = "Matched kicker (normalized)"
+                if kicker_match is not None:
+                    user_player_id, sleeper_player = kicker_match
+                    analysis['kickers'].append({
+                        'name': player_name,
+                        'rank': rank_idx + 1,
+                        'team': sleeper_player.get('team', ''),
+                        'sleeper_id': user_player_id,
+                        'is_on_roster': True
+                    })
+                    logger.debug("%s: %s - Rank #%d", match_label, player_name, rank_idx + 1)
+                    is_on_roster = True
                 
                 # If not on roster, check if it's available (not owned by any team in the league)
                 if not is_on_roster:
                     # Check if this kicker is owned by any team in the league
-                    is_available = True
-                    if all_league_players:
-                        for league_player in all_league_players:
-                            sleeper_player = sleeper_players.get(league_player.get('player_id', ''))
-                            if sleeper_player and sleeper_player.get('position') == 'K':
-                                sleeper_name = sleeper_player.get('full_name', '')
-                                
-                                # Check if this is the same kicker
-                                if (sleeper_name == player_name or
-                                    FantasyDraftTool._normalize_name(sleeper_name) == FantasyDraftTool._normalize_name(player_name)):
-                                    is_available = False
-                                    break
+                    is_available = not (
+                        player_name in owned_k_names or
+                        FantasyDraftTool._normalize_name(player_name) in owned_k_normalized_names
+                    )
                     
                     if is_available:
                         analysis['waiver_suggestions']['kickers'].append({
@@ -1123,22 +1600,19 @@ class FantasyDraftTool:
                             'is_on_roster': False
                         })
             
-            print(f"Found {len(analysis['kickers'])} kickers on roster")
+            logger.debug("Found %d kickers on roster", len(analysis['kickers']))
         
         # Sort DST and K by rank
         analysis['defenses'].sort(key=lambda x: x['rank'])
         analysis['kickers'].sort(key=lambda x: x['rank'])
-        analysis['waiver_suggestions']['defenses'].sort(key=lambda x: x['rank'])
-        analysis['waiver_suggestions']['kickers'].sort(key=lambda x: x['rank'])
         
         # Create combined top 5 lists for waiver suggestions (including your own players)
-        all_defenses = analysis['defenses'] + analysis['waiver_suggestions']['defenses']
-        all_defenses.sort(key=lambda x: x['rank'])
-        analysis['waiver_suggestions']['defenses'] = all_defenses[:5]  # Top 5 overall
-        
-        all_kickers = analysis['kickers'] + analysis['waiver_suggestions']['kickers']
-        all_kickers.sort(key=lambda x: x['rank'])
-        analysis['waiver_suggestions']['kickers'] = all_kickers[:5]  # Top 5 overall
+        analysis['waiver_suggestions']['defenses'] = heapq.nsmallest(  # Top 5 overall
+            5, analysis['defenses'] + analysis['waiver_suggestions']['defenses'], key=lambda x: x['rank']
+        )
+        analysis['waiver_suggestions']['kickers'] = heapq.nsmallest(  # Top 5 overall
+            5, analysis['kickers'] + analysis['waiver_suggestions']['kickers'], key=lambda x: x['rank']
+        )
         
         # Determine starting lineup based on roster requirements
         starters = []
@@ -1162,69 +1636,18 @@ class FantasyDraftTool:
         # First pass: Fill required positions
         for player in user_offensive_players:
             pos = player['position']
-            if pos in position_requirements and position_used[pos] < position_requirements[pos]:
+            used = position_used.get(pos, 0)
+            if used < position_requirements.get(pos, 0):
                 starters.append(player)
-                position_used[pos] += 1
+                position_used[pos] = used + 1
             else:
                 bench.append(player)
         
-        # Second pass: Fill flex positions
-        # Create lists of eligible players for each flex type
-        all_flex_players = [p for p in bench if p['position'] in ['QB', 'RB', 'WR', 'TE']]
-        wrrbte_flex_players = [p for p in bench if p['position'] in ['RB', 'WR', 'TE']]
-        wrrb_flex_players = [p for p in bench if p['position'] in ['RB', 'WR']]
-        
-        # Sort all lists by rank (ascending - lower rank is better)
-        all_flex_players.sort(key=lambda x: x['rank'])
-        wrrbte_flex_players.sort(key=lambda x: x['rank'])
-        wrrb_flex_players.sort(key=lambda x: x['rank'])
-        
-        # Fill SUPER_FLEX (can use QB, RB, WR, or TE) - highest priority
-        super_flex_needed = position_requirements.get('SUPER_FLEX', 0)
-        for _ in range(super_flex_needed):
-            if all_flex_players:
-                best_flex = all_flex_players.pop(0)
-                best_flex['flex_slot'] = 'SUPER_FLEX'  # Track which flex slot this player fills
-                starters.append(best_flex)
-                bench.remove(best_flex)
-                # Remove from other flex lists if present
-                if best_flex in wrrbte_flex_players:
-                    wrrbte_flex_players.remove(best_flex)
-                if best_flex in wrrb_flex_players:
-                    wrrb_flex_players.remove(best_flex)
-        
-        # Fill FLEX (can use RB, WR, or TE)
-        flex_needed = position_requirements.get('FLEX', 0)
-        for _ in range(flex_needed):
-            if wrrbte_flex_players:
-                best_flex = wrrbte_flex_players.pop(0)
-                best_flex['flex_slot'] = 'FLEX'  # Track which flex slot this player fills
-                starters.append(best_flex)
-                bench.remove(best_flex)
-                # Remove from WRRB_FLEX list if present
-                if best_flex in wrrb_flex_players:
-                    wrrb_flex_players.remove(best_flex)
-        
-        # Fill WRRBTE_FLEX (can use RB, WR, or TE) - same as FLEX
-        wrrbte_flex_needed = position_requirements.get('WRRBTE_FLEX', 0)
-        for _ in range(wrrbte_flex_needed):
-            if wrrbte_flex_players:
-                best_flex = wrrbte_flex_players.pop(0)
-                best_flex['flex_slot'] = 'WRRBTE_FLEX'  # Track which flex slot this player fills
-                starters.append(best_flex)
-                bench.remove(best_flex)
-                # Remove from WRRB_FLEX list if present
-                if best_flex in wrrb_flex_players:
-                    wrrb_flex_players.remove(best_flex)
-        
-        # Fill WRRB_FLEX (can use RB or WR only)
-        wrrb_flex_needed = position_requirements.get('WRRB_FLEX', 0)
-        for _ in range(wrrb_flex_needed):
-            if wrrb_flex_players:
-                best_flex = wrrb_flex_players.pop(0)
-                best_flex['flex_slot'] = 'WRRB_FLEX'  # Track which flex slot this player fills
-                starters.append(best_flex)
-                bench.remove(best_flex)
+        # Second pass: Fill flex positions (SUPER_FLEX, FLEX, WRRBTE_FLEX, then WRRB_FLEX)
+        flex_picks, bench = FantasyDraftTool._fill_flex_slots(bench, position_requirements)
+        for flex_slot, best_flex in flex_picks:
+            best_flex['flex_slot'] = flex_slot  # Track which flex slot this player fills
+            starters.append(best_flex)
         
         # Sort starters by roster requirements order and rank within position
         sorted_starters = []
@@ -1234,9 +1657,8 @@ class FantasyDraftTool:
         
         # Add positions in the order they appear in roster_settings with their counts
         for pos, count in roster_settings.items():
-            if count > 0 and pos in ['QB', 'RB', 'WR', 'TE', 'SUPER_FLEX', 'FLEX', 'WRRBTE_FLEX', 'WRRB_FLEX']:
-                for _ in range(count):
-                    position_order.append(pos)
+            if count > 0 and pos in _LINEUP_SLOTS:
+                position_order.extend([pos] * count)
         
         # Group starters by their assigned position slot
         # For flex players, use their flex_slot, for others use their position
@@ -1248,11 +1670,12 @@ class FantasyDraftTool:
                 starters_by_pos[pos] = []
             starters_by_pos[pos].append(starter)
         
-        # Debug: print what we have
-        print(f"Starters by position: {list(starters_by_pos.keys())}")
-        print(f"Position order from roster settings: {position_order}")
-        for pos, players in starters_by_pos.items():
-            print(f"{pos}: {[p['name'] for p in players]}")
+        # Debug: log what we have
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Starters by position: %s", list(starters_by_pos.keys()))
+            logger.debug("Position order from roster settings: %s", position_order)
+            for pos, players in starters_by_pos.items():
+                logger.debug("%s: %s", pos, [p['name'] for p in players])
         
         # Sort each position group by rank (ascending - lower rank is better)
         for pos in starters_by_pos:
@@ -1340,22 +1763,29 @@ class FantasyDraftTool:
         return analysis
 
     @staticmethod
-    def analyze_optimal_lineup_with_free_agents(weekly_rankings: Dict[str, List[Dict]], user_players: List[dict], 
+    def analyze_optimal_lineup_with_free_agents(weekly_rankings: Dict[str, List[Dict]], user_players: List[str], 
                                               sleeper_players: Dict[str, dict], roster_settings: Dict, 
-                                              all_league_players: List[dict] = None) -> Dict:
-        """Analyze optimal starting lineup by finding the best possible combination from roster + free agents."""
+                                              all_league_players: List[str] = None,
+                                              current_analysis: Optional[Dict] = None) -> Dict:
+        """Analyze optimal starting lineup by finding the best possible combination from roster + free agents.
+
+        Pass current_analysis when analyze_weekly_rankings() has already been run
+        with the same arguments to avoid repeating it; it is not modified.
+        """
         if all_league_players is None:
             all_league_players = []
+        user_players = FantasyDraftTool._player_ids(user_players)
+        all_league_players = FantasyDraftTool._player_ids(all_league_players)
             
         # Get all players owned by other teams (to exclude from free agents)
-        owned_player_ids = set()
-        for roster_player in all_league_players:
-            owned_player_ids.add(roster_player['player_id'])
+        owned_player_ids = set(all_league_players)
+        user_player_ids = set(user_players)
         
         # First, get the current starting lineup analysis for comparison
-        current_analysis = FantasyDraftTool.analyze_weekly_rankings(
-            weekly_rankings, user_players, sleeper_players, roster_settings, all_league_players
-        )
+        if current_analysis is None:
+            current_analysis = FantasyDraftTool.analyze_weekly_rankings(
+                weekly_rankings, user_players, sleeper_players, roster_settings, all_league_players
+            )
         current_starters = current_analysis.get('starters', [])
         
         # Build combined pool of ALL available players (roster + free agents)
@@ -1365,67 +1795,60 @@ class FantasyDraftTool:
         if 'OP' in weekly_rankings:
             op_rankings = weekly_rankings['OP']
             
-            for rank_idx, ranking in enumerate(op_rankings):
-                if not isinstance(ranking, dict) or not ranking:
-                    continue
-                    
-                player_name = ranking.get('PLAYER NAME', '').strip()
-                position_with_rank = ranking.get('POS', '').strip()
-                
-                if not player_name or not position_with_rank:
+            # Group ranking rows by position so each position is matched in one pass
+            rows_by_position: Dict[str, List[Tuple[int, str, str]]] = {}
+            for rank_idx, player_name, position_with_rank in FantasyDraftTool._ranking_rows(op_rankings, 'POS'):
+                if not position_with_rank:
                     continue
                 
                 # Extract base position
-                base_position = position_with_rank
-                if position_with_rank and position_with_rank[0].isalpha():
-                    for i, char in enumerate(position_with_rank):
-                        if char.isdigit():
-                            base_position = position_with_rank[:i]
-                            break
+                base_position = _base_position(position_with_rank)
                 
                 # Skip DST and K as they're handled separately
-                if base_position in ['DEF', 'K']:
+                if base_position in _SPECIAL_TEAMS_POSITIONS:
                     continue
                 
-                # Find matching sleeper player
-                found_sleeper_id = None
-                normalized_fp = FantasyDraftTool._normalize_name(player_name)
+                rows_by_position.setdefault(base_position, []).append((rank_idx, player_name, position_with_rank))
+            
+            # Normalized Sleeper names by position, in dump order
+            name_index = _sleeper_name_index(sleeper_players)
+            
+            for position, rows in rows_by_position.items():
+                sleeper_names = name_index.position_full_names.get(position)
+                if not sleeper_names:
+                    continue
+                exact_ids = name_index.position_exact[position]
                 
-                for sleeper_id, sleeper_player in sleeper_players.items():
-                    if sleeper_player.get('position') != base_position:
-                        continue
-                        
-                    sleeper_name = sleeper_player.get('full_name', '')
-                    normalized_sleeper = FantasyDraftTool._normalize_name(sleeper_name)
-                    
-                    # Try exact match first
-                    if normalized_fp == normalized_sleeper:
-                        found_sleeper_id = sleeper_id
-                        break
-                    
-                    # Try fuzzy matching with high threshold
-                    score = fuzz.ratio(normalized_fp, normalized_sleeper)
-                    if score >= 95:
-                        # Additional validation: check first name similarity
-                        fp_first = normalized_fp.split()[0] if normalized_fp.split() else ""
-                        sleeper_first = normalized_sleeper.split()[0] if normalized_sleeper.split() else ""
-                        first_name_score = fuzz.ratio(fp_first, sleeper_first)
-                        
-                        if first_name_score >= 85:
-                            found_sleeper_id = sleeper_id
-                            break
+                # Find matching sleeper player: an exact normalized name match first,
+                # then the first one (in dump order) passing the fuzzy full and first
+                # name checks
+                found_ids: List[Optional[str]] = []
+                fuzzy_rows: List[int] = []
+                for row, (_, player_name, _) in enumerate(rows):
+                    found_ids.append(exact_ids.get(FantasyDraftTool._normalize_name(player_name)))
+                    if found_ids[-1] is None:
+                        fuzzy_rows.append(row)
+                if fuzzy_rows:
+                    _, matches = FantasyDraftTool._name_match_matrix(
+                        [FantasyDraftTool._normalize_name(rows[row][1]) for row in fuzzy_rows], sleeper_names
+                    )
+                    for row, sleeper_index, row_matches in zip(fuzzy_rows, matches.argmax(axis=1), matches):
+                        if row_matches[sleeper_index]:
+                            found_ids[row] = name_index.position_ids[position][sleeper_index]
                 
-                if found_sleeper_id:
+                for (rank_idx, player_name, position_with_rank), found_sleeper_id in zip(rows, found_ids):
+                    if found_sleeper_id is None:
+                        continue
                     sleeper_player = sleeper_players[found_sleeper_id]
                     
                     # Check if this player is on user's roster or available as free agent
-                    is_on_roster = any(up['player_id'] == found_sleeper_id for up in user_players)
+                    is_on_roster = found_sleeper_id in user_player_ids
                     is_free_agent = found_sleeper_id not in owned_player_ids and not is_on_roster
                     
                     if is_on_roster or is_free_agent:
                         all_available_players.append({
                             'name': player_name,
-                            'position': base_position,
+                            'position': position,
                             'position_with_rank': position_with_rank,
                             'rank': rank_idx + 1,
                             'team': sleeper_player.get('team', ''),
@@ -1459,82 +1882,26 @@ class FantasyDraftTool:
         # PHASE 1: Fill required positions first (QB, RB, WR, TE) - same as working code
         for player in all_available_players:
             pos = player['position']
-            if pos in position_requirements and position_used[pos] < position_requirements[pos]:
+            used = position_used.get(pos, 0)
+            if used < position_requirements.get(pos, 0):
                 optimal_starters.append(player.copy())
-                position_used[pos] += 1
+                position_used[pos] = used + 1
             else:
                 bench.append(player)
         
         # PHASE 2: Fill flex positions from bench - same logic as working code
-        # Create lists of eligible players for each flex type
-        all_flex_players = [p for p in bench if p['position'] in ['QB', 'RB', 'WR', 'TE']]
-        wrrbte_flex_players = [p for p in bench if p['position'] in ['RB', 'WR', 'TE']]
-        wrrb_flex_players = [p for p in bench if p['position'] in ['RB', 'WR']]
-        
-        # Sort all lists by rank (ascending - lower rank is better)
-        all_flex_players.sort(key=lambda x: x['rank'])
-        wrrbte_flex_players.sort(key=lambda x: x['rank'])
-        wrrb_flex_players.sort(key=lambda x: x['rank'])
-        
-        # Fill SUPER_FLEX (can use QB, RB, WR, or TE) - highest priority
-        super_flex_needed = position_requirements.get('SUPER_FLEX', 0)
-        for _ in range(super_flex_needed):
-            if all_flex_players:
-                best_flex = all_flex_players.pop(0)
-                best_flex_copy = best_flex.copy()
-                best_flex_copy['flex_slot'] = 'SUPER_FLEX'
-                optimal_starters.append(best_flex_copy)
-                bench.remove(best_flex)
-                # Remove from other flex lists if present
-                if best_flex in wrrbte_flex_players:
-                    wrrbte_flex_players.remove(best_flex)
-                if best_flex in wrrb_flex_players:
-                    wrrb_flex_players.remove(best_flex)
-        
-        # Fill FLEX (can use RB, WR, or TE)
-        flex_needed = position_requirements.get('FLEX', 0)
-        for _ in range(flex_needed):
-            if wrrbte_flex_players:
-                best_flex = wrrbte_flex_players.pop(0)
-                best_flex_copy = best_flex.copy()
-                best_flex_copy['flex_slot'] = 'FLEX'
-                optimal_starters.append(best_flex_copy)
-                bench.remove(best_flex)
-                # Remove from WRRB_FLEX list if present
-                if best_flex in wrrb_flex_players:
-                    wrrb_flex_players.remove(best_flex)
-        
-        # Fill WRRBTE_FLEX (can use RB, WR, or TE) - same as FLEX
-        wrrbte_flex_needed = position_requirements.get('WRRBTE_FLEX', 0)
-        for _ in range(wrrbte_flex_needed):
-            if wrrbte_flex_players:
-                best_flex = wrrbte_flex_players.pop(0)
-                best_flex_copy = best_flex.copy()
-                best_flex_copy['flex_slot'] = 'WRRBTE_FLEX'
-                optimal_starters.append(best_flex_copy)
-                bench.remove(best_flex)
-                # Remove from WRRB_FLEX list if present
-                if best_flex in wrrb_flex_players:
-                    wrrb_flex_players.remove(best_flex)
-        
-        # Fill WRRB_FLEX (can use RB or WR only)
-        wrrb_flex_needed = position_requirements.get('WRRB_FLEX', 0)
-        for _ in range(wrrb_flex_needed):
-            if wrrb_flex_players:
-                best_flex = wrrb_flex_players.pop(0)
-                best_flex_copy = best_flex.copy()
-                best_flex_copy['flex_slot'] = 'WRRB_FLEX'
-                optimal_starters.append(best_flex_copy)
-                bench.remove(best_flex)
+        flex_picks, bench = FantasyDraftTool._fill_flex_slots(bench, position_requirements)
+        for flex_slot, best_flex in flex_picks:
+            best_flex_copy = best_flex.copy()
+            best_flex_copy['flex_slot'] = flex_slot
+            optimal_starters.append(best_flex_copy)
         
         # Add DST and K from current analysis (no optimization needed)
         for starter in current_starters:
-            if starter['position'] in ['DEF', 'K']:
+            if starter['position'] in _SPECIAL_TEAMS_POSITIONS:
                 optimal_starters.append(starter)
         
         # Compare optimal vs current lineup to identify upgrades
-        free_agent_upgrades = []
-        
         # Create sets of player IDs for comparison
         current_player_ids = {s.get('sleeper_id') for s in current_starters if s.get('sleeper_id')}
         optimal_player_ids = {s.get('sleeper_id') for s in optimal_starters if s.get('sleeper_id')}
@@ -1546,55 +1913,7 @@ class FantasyDraftTool:
         dropped_players = [p for p in current_starters if p.get('sleeper_id') not in optimal_player_ids]
         
         # Match adds with drops to create upgrade pairs
-        for added_player in added_players:
-            if added_player.get('is_free_agent', False):
-                # Find the best matching dropped player (same position or flex eligible)
-                best_match = None
-                best_improvement = 0
-                
-                for dropped_player in dropped_players:
-                    # Skip DST/K for this analysis
-                    if dropped_player['position'] in ['DEF', 'K']:
-                        continue
-                        
-                    # Check if this is a valid replacement
-                    can_replace = False
-                    
-                    # Same position replacement
-                    if added_player['position'] == dropped_player['position']:
-                        can_replace = True
-                    
-                    # Flex position replacement - check if both can fill flex
-                    elif (added_player.get('flex_slot') and dropped_player.get('flex_slot')):
-                        # Both are in flex positions
-                        added_eligible = added_player['position'] in ['RB', 'WR', 'TE']
-                        dropped_eligible = dropped_player['position'] in ['RB', 'WR', 'TE']
-                        if added_eligible and dropped_eligible:
-                            can_replace = True
-                    
-                    # Cross-position flex replacement (e.g., RB in flex replacing WR in flex)
-                    elif (added_player.get('flex_slot') or dropped_player.get('flex_slot')):
-                        added_eligible = added_player['position'] in ['RB', 'WR', 'TE']
-                        dropped_eligible = dropped_player['position'] in ['RB', 'WR', 'TE']
-                        if added_eligible and dropped_eligible:
-                            can_replace = True
-                    
-                    if can_replace:
-                        improvement = dropped_player['rank'] - added_player['rank']
-                        if improvement > best_improvement:
-                            best_improvement = improvement
-                            best_match = dropped_player
-                
-                if best_match and best_improvement > 0:
-                    added_player['replaces_player'] = best_match
-                    free_agent_upgrades.append({
-                        'position': added_player['position'],
-                        'drop': best_match,
-                        'add': added_player,
-                        'improvement': best_improvement
-                    })
-                    # Remove the matched dropped player so it's not matched again
-                    dropped_players.remove(best_match)
+        free_agent_upgrades = FantasyDraftTool._pair_upgrades(added_players, dropped_players)
         
         return {
             'optimal_starters': optimal_starters,
@@ -1607,9 +1926,7 @@ class FantasyDraftTool:
         """Get league roster settings to understand lineup requirements."""
         try:
             url = f"https://api.sleeper.app/v1/league/{league_id}"
-            resp = requests.get(url)
-            resp.raise_for_status()
-            league_data = resp.json()
+            league_data = _get_json_revalidated(url)
             
             # Extract roster settings
             roster_positions = league_data.get('roster_positions', [])
@@ -1630,9 +1947,8 @@ class FantasyDraftTool:
 
         print("Fetching current draft picks from Sleeper...")
         try:
-            response = requests.get(f"https://api.sleeper.app/v1/draft/{self.sleeper_draft_id}/picks")
-            response.raise_for_status()
-            picks = response.json()
+            # Conditional request: between picks the server can answer 304
+            picks = _get_json_revalidated(f"https://api.sleeper.app/v1/draft/{self.sleeper_draft_id}/picks")
 
             drafted_ids: Set[str] = set()
             # Build a mapping of drafted Sleeper player IDs
@@ -1658,15 +1974,15 @@ class FantasyDraftTool:
         if not self.drafted_sleeper_ids:
             return
 
-        # Build normalized name map for drafted Sleeper players
-        drafted_normalized_names: Set[str] = set()
-        drafted_position_by_id: Dict[str, str] = {}
+        # Build normalized name -> positions map for drafted Sleeper players
+        drafted_positions_by_name: Dict[str, Set[str]] = {}
         for drafted_id in self.drafted_sleeper_ids:
             sp = self.sleeper_players.get(drafted_id)
             if not sp:
                 continue
-            drafted_position_by_id[drafted_id] = sp.get('position', '')
-            drafted_normalized_names.add(self._normalize_name(sp.get('full_name', '')))
+            drafted_positions_by_name.setdefault(self._normalize_name(sp.get('full_name', '')), set()).add(
+                (sp.get('position') or '').upper()
+            )
 
         # First pass: Apply drafted status where we have a Sleeper ID direct match
         for player in self.players:
@@ -1677,20 +1993,13 @@ class FantasyDraftTool:
         for player in self.players:
             if player.drafted:
                 continue
-            norm_name = self._normalize_name(player.name)
-            if norm_name in drafted_normalized_names:
+            drafted_positions = drafted_positions_by_name.get(self._normalize_name(player.name))
+            if drafted_positions:
                 # If we can verify position, do so to avoid false positives
-                # Sleeper positions are like 'QB', 'RB', 'WR', 'TE'
-                # Try to find a drafted sleeper player with same normalized name and same position
-                for drafted_id in self.drafted_sleeper_ids:
-                    sp = self.sleeper_players.get(drafted_id)
-                    if not sp:
-                        continue
-                    if self._normalize_name(sp.get('full_name', '')) == norm_name:
-                        sleeper_pos = (sp.get('position') or '').upper()
-                        if not sleeper_pos or sleeper_pos == player.position:
-                            player.drafted = True
-                            break
+                # Sleeper positions are like 'QB', 'RB', 'WR', 'TE'; a drafted
+                # player without a position still counts
+                if '' in drafted_positions or player.position in drafted_positions:
+                    player.drafted = True
 
     def get_unmatched_drafted_from_sleeper(self) -> List[dict]:
         """Return drafted Sleeper players that we could not map to any of our players."""
@@ -1717,20 +2026,35 @@ class FantasyDraftTool:
                 })
         return unmatched
     
+    def _players_by_rank(self) -> Tuple[List[Player], Dict[str, List[Player]]]:
+        """Return self.players sorted by overall rank, overall and per position.
+
+        The sort is redone only when self.players is replaced or resized; drafted
+        flags are read by the callers, so drafting players doesn't invalidate it.
+        """
+        cached = self._rank_order
+        if cached is None or cached[0] is not self.players or cached[1] != len(self.players):
+            ordered = sorted(self.players, key=lambda x: x.overall_rank)
+            by_position: Dict[str, List[Player]] = {}
+            for player in ordered:
+                by_position.setdefault(player.position, []).append(player)
+            cached = (self.players, len(self.players), ordered, by_position)
+            self._rank_order = cached
+        return cached[2], cached[3]
+
     def get_top_players_by_position(self, position: str, limit: int = 3) -> List[Player]:
         """Get top N players for a specific position"""
-        position_players = [p for p in self.players if p.position == position and not p.drafted]
-        return sorted(position_players, key=lambda x: x.overall_rank)[:limit]
+        position_players = self._players_by_rank()[1].get(position, [])
+        return list(itertools.islice((p for p in position_players if not p.drafted), limit))
 
     def get_top_overall_available(self, limit: int = 5) -> List[Player]:
         """Get top N overall players that are not drafted yet"""
-        available_players = [p for p in self.players if not p.drafted]
-        return sorted(available_players, key=lambda x: x.overall_rank)[:limit]
+        ordered = self._players_by_rank()[0]
+        return list(itertools.islice((p for p in ordered if not p.drafted), limit))
 
     def get_drafted_players(self) -> List[Player]:
         """Get all players marked as drafted, ordered by overall rank"""
-        drafted_players = [p for p in self.players if p.drafted]
-        return sorted(drafted_players, key=lambda x: x.overall_rank)
+        return [p for p in self._players_by_rank()[0] if p.drafted]
     
     def display_draft_board(self) -> None:
         """Display the draft board with top 3 players per position"""
@@ -1812,9 +2136,11 @@ def main():
         # Initialize the tool
         draft_tool = FantasyDraftTool(csv_file)
         
-        # Load data
-        draft_tool.load_fantasypros_data()
-        draft_tool.fetch_sleeper_data()
+        # Load data; the Sleeper players download overlaps with CSV parsing
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            sleeper_fetch = executor.submit(draft_tool.fetch_sleeper_data)
+            draft_tool.load_fantasypros_data()
+            sleeper_fetch.result()
         draft_tool.match_players()
 
         # Optional: configure Sleeper draft ID for live syncing
@@ -4,13 +4,57 @@ League Manager for Fantasyzer
 Handles saving, loading, editing, and managing multiple league draft URLs
 """
 
+import atexit
 import json
 import os
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+import time
+import weakref
+from collections import OrderedDict
+from typing import Dict, KeysView, List, Optional
+from dataclasses import dataclass, fields
 from datetime import datetime
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # stdlib fallback
+    orjson = None
+
+# mark_league_used writes at most once per this many seconds; the rest are
+# flushed by the next save or at interpreter exit
+MARK_USED_FLUSH_SECONDS = 2.0
+
+# Managers with possibly deferred writes. Held weakly so a discarded manager is
+# neither kept alive nor flushed over a newer one's file at exit
+_live_managers: "weakref.WeakSet[LeagueManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_managers() -> None:
+    for manager in list(_live_managers):
+        manager._flush_if_dirty()
+
+
+def _dumps_leagues(leagues: Dict[str, 'League']) -> bytes:
+    """Encode leagues by name as indented UTF-8 JSON."""
+    if orjson is not None:
+        # orjson encodes the League dataclasses natively
+        return orjson.dumps(leagues, option=orjson.OPT_INDENT_2)
+    data = {name: _league_dict(league) for name, league in leagues.items()}
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _by_last_used(leagues: Dict[str, 'League']) -> "OrderedDict[str, League]":
+    """Order leagues most recently used first."""
+    return OrderedDict(sorted(leagues.items(), key=lambda item: item[1].last_used, reverse=True))
+
+
+def _loads(data):
+    """Decode JSON from bytes or str, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@dataclass(slots=True)
 class League:
     """Represents a saved fantasy league"""
     name: str
@@ -19,6 +63,13 @@ class League:
     created_at: str
     last_used: str
 
+_LEAGUE_FIELDS = tuple(f.name for f in fields(League))
+
+
+def _league_dict(league: League) -> Dict[str, str]:
+    """Flat field dict for a League; cheaper than the recursive asdict()."""
+    return {field: getattr(league, field) for field in _LEAGUE_FIELDS}
+
 class LeagueManager:
     def __init__(self, storage_file: str = None, user_id: str = None):
         # Generate unique storage file per user to prevent data sharing
@@ -30,39 +81,64 @@ class LeagueManager:
             storage_file = f"saved_leagues_{user_id}.json"
         
         self.storage_file = storage_file
-        self.leagues: Dict[str, League] = {}
+        # Kept most recently used first, so the order never needs re-sorting
+        self.leagues: "OrderedDict[str, League]" = OrderedDict()
+        self._dirty = False
+        self._last_flush = time.monotonic()
         self.load_leagues()
+        _live_managers.add(self)
     
     def load_leagues(self) -> None:
         """Load saved leagues from JSON file"""
         try:
             if os.path.exists(self.storage_file):
-                with open(self.storage_file, 'r', encoding='utf-8') as f:
-                    leagues_data = json.load(f)
-                    self.leagues = {
-                        name: League(**league_data) 
-                        for name, league_data in leagues_data.items()
-                    }
+                # Slurp the file in one read and parse after it is closed
+                with open(self.storage_file, 'rb') as f:
+                    data = f.read()
+                leagues_data = _loads(data)
+                self.leagues = _by_last_used({
+                    name: League(**league_data) 
+                    for name, league_data in leagues_data.items()
+                })
                 print(f"Loaded {len(self.leagues)} saved leagues")
             else:
                 print("No saved leagues file found, starting fresh")
         except Exception as e:
             print(f"Error loading leagues: {e}")
-            self.leagues = {}
+            self.leagues = OrderedDict()
+            # Keep the unreadable file so the next save can't overwrite it
+            if os.path.exists(self.storage_file):
+                backup_file = self.storage_file + '.bak'
+                try:
+                    os.replace(self.storage_file, backup_file)
+                    print(f"Moved unreadable leagues file to {backup_file}")
+                except OSError as e:
+                    print(f"Error backing up leagues file: {e}")
     
     def save_leagues(self) -> None:
         """Save leagues to JSON file"""
         try:
-            leagues_data = {
-                name: asdict(league) 
-                for name, league in self.leagues.items()
-            }
-            with open(self.storage_file, 'w', encoding='utf-8') as f:
-                json.dump(leagues_data, f, indent=2, ensure_ascii=False)
+            # Encode once and write once; json.dump issues a write per token
+            data = _dumps_leagues(self.leagues)
+            # Write a temp file and swap it in, so a crash never leaves a
+            # half-written snapshot behind
+            tmp_file = self.storage_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.storage_file)
+            self._dirty = False
+            self._last_flush = time.monotonic()
             print(f"Saved {len(self.leagues)} leagues")
         except Exception as e:
             print(f"Error saving leagues: {e}")
     
+    def _flush_if_dirty(self) -> None:
+        """Write out timestamp updates deferred by mark_league_used"""
+        if self._dirty:
+            self.save_leagues()
+    
     def add_league(self, name: str, draft_url: str, draft_id: str) -> bool:
         """Add a new league"""
         if name in self.leagues:
@@ -78,29 +154,36 @@ class LeagueManager:
         )
         
         self.leagues[name] = league
+        self.leagues.move_to_end(name, last=False)
         self.save_leagues()
         return True
     
     def update_league(self, name: str, draft_url: str, draft_id: str) -> bool:
         """Update an existing league"""
-        if name not in self.leagues:
+        league = self.leagues.get(name)
+        if league is None:
             return False
         
+        if league.draft_url == draft_url and league.draft_id == draft_id:
+            # Nothing but the timestamp changes; take the debounced path
+            self.mark_league_used(name)
+            return True
+        
         now = datetime.now().isoformat()
-        self.leagues[name].draft_url = draft_url
-        self.leagues[name].draft_id = draft_id
-        self.leagues[name].last_used = now
+        league.draft_url = draft_url
+        league.draft_id = draft_id
+        league.last_used = now
+        self.leagues.move_to_end(name, last=False)
         
         self.save_leagues()
         return True
     
     def delete_league(self, name: str) -> bool:
         """Delete a league"""
-        if name in self.leagues:
-            del self.leagues[name]
-            self.save_leagues()
-            return True
-        return False
+        if self.leagues.pop(name, None) is None:
+            return False
+        self.save_leagues()
+        return True
     
     def get_league(self, name: str) -> Optional[League]:
         """Get a specific league by name"""
@@ -110,25 +193,29 @@ class LeagueManager:
         """Get list of all league names"""
         return list(self.leagues.keys())
     
+    def iter_league_names(self) -> KeysView[str]:
+        """Live view of league names, most recently used first; no copy is made"""
+        return self.leagues.keys()
+    
     def get_league_names_sorted(self) -> List[str]:
         """Get league names sorted by last used (most recent first)"""
-        sorted_leagues = sorted(
-            self.leagues.values(), 
-            key=lambda x: x.last_used, 
-            reverse=True
-        )
-        return [league.name for league in sorted_leagues]
+        return list(self.leagues)
     
     def mark_league_used(self, name: str) -> None:
         """Mark a league as recently used"""
-        if name in self.leagues:
-            self.leagues[name].last_used = datetime.now().isoformat()
+        league = self.leagues.get(name)
+        if league is None:
+            return
+        league.last_used = datetime.now().isoformat()
+        self.leagues.move_to_end(name, last=False)
+        self._dirty = True
+        if time.monotonic() - self._last_flush > MARK_USED_FLUSH_SECONDS:
             self.save_leagues()
     
     def export_leagues(self) -> str:
         """Export leagues to JSON string for sharing/backup"""
         try:
-            return json.dumps(self.leagues, indent=2, ensure_ascii=False, default=asdict)
+            return _dumps_leagues(self.leagues).decode('utf-8')
         except Exception as e:
             print(f"Error exporting leagues: {e}")
             return "{}"
@@ -136,7 +223,10 @@ class LeagueManager:
     def import_leagues(self, json_data: str) -> bool:
         """Import leagues from JSON string"""
         try:
-            imported_leagues = json.loads(json_data)
+            imported_leagues = _loads(json_data)
+            leagues = dict(self.leagues)
+            # One timestamp for every entry in the batch that lacks its own
+            now = datetime.now().isoformat()
             for name, league_data in imported_leagues.items():
                 if isinstance(league_data, dict):
                     # Handle both old and new format
@@ -148,11 +238,13 @@ class LeagueManager:
                             name=name,
                             draft_url=league_data.get('draft_url', ''),
                             draft_id=league_data.get('draft_id', ''),
-                            created_at=league_data.get('created_at', datetime.now().isoformat()),
-                            last_used=league_data.get('last_used', datetime.now().isoformat())
+                            created_at=league_data.get('created_at', now),
+                            last_used=league_data.get('last_used', now)
                         )
-                    self.leagues[name] = league
+                    leagues[name] = league
             
+            # Imported entries carry their own timestamps
+            self.leagues = _by_last_used(leagues)
             self.save_leagues()
             return True
         except Exception as e:
@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
+import base64
+import heapq
 import os
+from html import escape
+from types import MappingProxyType
 import re
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import io
+from concurrent.futures import ThreadPoolExecutor
 
 import streamlit as st
 
@@ -18,6 +23,13 @@ def initialize_session_state() -> None:
         st.session_state.draft_tool = None
 
 
+# Draft path in any Sleeper URL: sleeper.com/draft/nfl/ID or sleeper.app/draft/ID,
+# with or without the protocol and host
+_DRAFT_URL_RE = re.compile(r'/draft/(?:nfl/)?(\d+)')
+# Just the number if that's all they paste
+_DRAFT_ID_RE = re.compile(r'\d+')
+
+
 def extract_draft_id_from_url(url: str) -> str:
     """Extract draft ID from Sleeper URL"""
     if not url:
@@ -26,28 +38,19 @@ def extract_draft_id_from_url(url: str) -> str:
     # Remove any whitespace
     url = url.strip()
     
-    # Handle different URL formats
-    patterns = [
-        r'https?://sleeper\.com/draft/nfl/(\d+)',  # New format: sleeper.com/draft/nfl/ID
-        r'https?://sleeper\.app/draft/(\d+)',      # Old format: sleeper.app/draft/ID
-        r'sleeper\.com/draft/nfl/(\d+)',           # Without protocol
-        r'sleeper\.app/draft/(\d+)',               # Without protocol
-        r'/draft/nfl/(\d+)',                       # Just path with nfl
-        r'/draft/(\d+)',                           # Just path
-        r'(\d+)'                                   # Just the number if that's all they paste
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
+    # Just the ID pasted on its own (isdecimal matches exactly what \d does)
+    if url.isdecimal():
+        return url
     
-    return ""
+    # One scan covers every URL format; fall back to the first run of digits
+    match = _DRAFT_URL_RE.search(url)
+    if match:
+        return match.group(1)
+    match = _DRAFT_ID_RE.search(url)
+    return match.group(0) if match else ""
 
-def inject_css() -> None:
-    """Inject minimal CSS for readable vertical player cards."""
-    st.markdown(
-        """
+# Styles for readable vertical player cards
+_CSS_BLOCK = """
         <style>
         /* App background and sidebar (white) */
         [data-testid="stAppViewContainer"] { background: #ffffff; color: #1f2937; }
@@ -171,25 +174,10 @@ def inject_css() -> None:
         .stSelectbox [data-baseweb="popover"] {
             background: #ffffff !important;
         }
-        .stSelectbox [data-baseweb="popover"] * {
-            background: #ffffff !important;
-            color: #1f2937 !important;
-        }
         /* Target any popover or dropdown containers */
         .stSelectbox [role="listbox"], .stSelectbox [role="menu"] {
             background: #ffffff !important;
         }
-        .stSelectbox [role="listbox"] *, .stSelectbox [role="menu"] * {
-            background: #ffffff !important;
-            color: #1f2937 !important;
-        }
-        /* Override any Streamlit-specific dropdown styling */
-        .stSelectbox [data-testid="stSelectbox"] {
-            background: #ffffff !important;
-        }
-        .stSelectbox [data-testid="stSelectbox"] * {
-            background: #ffffff !important;
-        }
         /* Fix expander header text color for readability */
         .streamlit-expanderHeader {
             color: #1f2937 !important;
@@ -263,6 +251,8 @@ def inject_css() -> None:
         .app-title { font-weight: 800; font-size: 2.2rem; margin-bottom: 0.25rem; color: #1f2937; }
         .app-caption { color: #4b5563; margin-bottom: 1.25rem; }
         .section-title { font-weight: 800; font-size: 1.4rem; margin: 0.5rem 0 0.75rem; color: #1f2937; }
+        .pos-grid { display: grid; grid-template-columns: repeat(2, minmax(0, 1fr)); gap: 0 1rem; }
+        @media (max-width: 640px) { .pos-grid { grid-template-columns: 1fr; } }
         .pos-header { font-weight: 800; font-size: 1.1rem; margin-bottom: 0.5rem; color: #1f2937; }
         /* Player cards */
         .player-card {
@@ -294,6 +284,11 @@ def inject_css() -> None:
         .player-content {
             flex: 1;
         }
+        /* Weekly rankings player line: small logo beside the text */
+        .player-row { display: flex; align-items: center; gap: 8px; margin-bottom: 8px; }
+        .player-row .player-logo-container { width: 30px; height: 30px; }
+        .player-row .player-logo { max-width: 30px; max-height: 30px; }
+        .player-row-caption { color: #6b7280; font-size: 0.875rem; white-space: pre-wrap; }
         .player-name { font-weight: 800; font-size: 1.05rem; margin-bottom: 4px; color: #1f2937; }
         .player-team { color: #6b7280; font-weight: 700; margin-left: 6px; }
         .player-meta { color: #4b5563; font-size: 0.92rem; margin-top: 2px; }
@@ -367,69 +362,116 @@ def inject_css() -> None:
             padding: 2px 6px !important;
         }
         </style>
-        """,
-        unsafe_allow_html=True,
-    )
+        """
+
+
+_RE_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_RE_CSS_SPACE = re.compile(r'\s+')
+_RE_CSS_PUNCT_SPACE = re.compile(r'\s*([{};,>])\s*')
+_RE_CSS_COLON_SPACE = re.compile(r':\s+')
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet.
+
+    Whitespace before ':' is kept, since it separates a descendant pseudo-class
+    selector (e.g. ``div :hover``) from its parent.
+    """
+    css = _RE_CSS_COMMENT.sub('', css)
+    css = _RE_CSS_SPACE.sub(' ', css)
+    css = _RE_CSS_PUNCT_SPACE.sub(r'\1', css)
+    css = _RE_CSS_COLON_SPACE.sub(':', css)
+    return css.replace(';}', '}').strip()
+
+
+@st.cache_data
+def _get_css() -> str:
+    """Return the minified stylesheet markup; cached across reruns and sessions."""
+    return _minify_css(_CSS_BLOCK)
+
+
+def inject_css() -> None:
+    """Inject minimal CSS for readable vertical player cards."""
+    # Streamlit drops elements a rerun doesn't emit, so this runs every rerun
+    st.markdown(_get_css(), unsafe_allow_html=True)
+
+
+# Map team abbreviations to logo file names (read-only)
+_TEAM_LOGO_FILES = MappingProxyType({
+    "ARI": "Arizona_Cardinals_logo.svg.png",
+    "ATL": "Atlanta_Falcons_logo.svg.png",
+    "BAL": "Baltimore_Ravens_logo.svg.png",
+    "BUF": "Buffalo_Bills_logo.svg.png",
+    "CAR": "Carolina_Panthers_logo.svg.png",
+    "CHI": "Chicago_Bears_logo.svg.png",
+    "CIN": "Cincinnati_Bengals_logo.svg.png",
+    "CLE": "Cleveland_Browns_logo.svg.png",
+    "DAL": "Dallas_Cowboys.svg.png",
+    "DEN": "Denver_Broncos_logo.svg.png",
+    "DET": "Detroit_Lions_logo.svg.png",
+    "GB": "Green_Bay_Packers_logo.svg.png",
+    "HOU": "Houston_Texans_logo.svg.png",
+    "IND": "Indianapolis_Colts_logo.svg.png",
+    "JAX": "Jacksonville_Jaguars_logo.svg.png",
+    "KC": "Kansas_City_Chiefs_logo.svg.png",
+    "LV": "Las_Vegas_Raiders_logo.svg.png",
+    "LAR": "Los_Angeles_Rams_logo.svg.png",
+    "LAC": "NFL_Chargers_logo.svg.png",
+    "MIA": "Miami_Dolphins_logo.svg.png",
+    "MIN": "Minnesota_Vikings_logo.svg.png",
+    "NE": "New_England_Patriots_logo.svg.png",
+    "NO": "New_Orleans_Saints_logo.svg.png",
+    "NYG": "New_York_Giants_logo.svg.png",
+    "NYJ": "New_York_Jets_logo.svg.png",
+    "PHI": "Philadelphia_Eagles_logo.svg.png",
+    "PIT": "Pittsburgh_Steelers_logo.svg.png",
+    "SF": "San_Francisco_49ers_logo.svg.png",
+    "SEA": "Seattle_Seahawks_logo.svg.png",
+    "TB": "Tampa_Bay_Buccaneers_logo.svg.png",
+    "TEN": "Tennessee_Titans_logo.svg.png",
+    "WAS": "Washington_football_team_wlogo.svg.png",
+    # Handle old team abbreviations
+    "OAK": "Las_Vegas_Raiders_logo.svg.png",  # Raiders old location
+    "SD": "NFL_Chargers_logo.svg.png",  # Chargers old location
+    "STL": "Los_Angeles_Rams_logo.svg.png",  # Rams old location
+})
+
+
+@st.cache_resource
+def _team_logo_paths() -> Dict[str, Optional[str]]:
+    """Logo path per team abbreviation (None if missing), checked on disk once."""
+    paths: Dict[str, Optional[str]] = {}
+    for team_abbrev, logo_filename in _TEAM_LOGO_FILES.items():
+        logo_path = f"Team Logos/{logo_filename}"
+        paths[team_abbrev] = logo_path if os.path.exists(logo_path) else None
+    return paths
 
 
 def get_team_logo_path(team_abbrev: str) -> Optional[str]:
     """Get the path to a team logo file based on team abbreviation."""
     if not team_abbrev:
         return None
-    
-    # Map team abbreviations to logo file names
-    team_logo_map = {
-        "ARI": "Arizona_Cardinals_logo.svg.png",
-        "ATL": "Atlanta_Falcons_logo.svg.png",
-        "BAL": "Baltimore_Ravens_logo.svg.png",
-        "BUF": "Buffalo_Bills_logo.svg.png",
-        "CAR": "Carolina_Panthers_logo.svg.png",
-        "CHI": "Chicago_Bears_logo.svg.png",
-        "CIN": "Cincinnati_Bengals_logo.svg.png",
-        "CLE": "Cleveland_Browns_logo.svg.png",
-        "DAL": "Dallas_Cowboys.svg.png",
-        "DEN": "Denver_Broncos_logo.svg.png",
-        "DET": "Detroit_Lions_logo.svg.png",
-        "GB": "Green_Bay_Packers_logo.svg.png",
-        "HOU": "Houston_Texans_logo.svg.png",
-        "IND": "Indianapolis_Colts_logo.svg.png",
-        "JAX": "Jacksonville_Jaguars_logo.svg.png",
-        "KC": "Kansas_City_Chiefs_logo.svg.png",
-        "LV": "Las_Vegas_Raiders_logo.svg.png",
-        "LAR": "Los_Angeles_Rams_logo.svg.png",
-        "LAC": "NFL_Chargers_logo.svg.png",
-        "MIA": "Miami_Dolphins_logo.svg.png",
-        "MIN": "Minnesota_Vikings_logo.svg.png",
-        "NE": "New_England_Patriots_logo.svg.png",
-        "NO": "New_Orleans_Saints_logo.svg.png",
-        "NYG": "New_York_Giants_logo.svg.png",
-        "NYJ": "New_York_Jets_logo.svg.png",
-        "PHI": "Philadelphia_Eagles_logo.svg.png",
-        "PIT": "Pittsburgh_Steelers_logo.svg.png",
-        "SF": "San_Francisco_49ers_logo.svg.png",
-        "SEA": "Seattle_Seahawks_logo.svg.png",
-        "TB": "Tampa_Bay_Buccaneers_logo.svg.png",
-        "TEN": "Tennessee_Titans_logo.svg.png",
-        "WAS": "Washington_football_team_wlogo.svg.png",
-        # Handle old team abbreviations
-        "OAK": "Las_Vegas_Raiders_logo.svg.png",  # Raiders old location
-        "SD": "NFL_Chargers_logo.svg.png",  # Chargers old location
-        "STL": "Los_Angeles_Rams_logo.svg.png",  # Rams old location
-    }
-    
-    logo_filename = team_logo_map.get(team_abbrev.upper())
-    if not logo_filename:
-        return None
-    
-    logo_path = f"Team Logos/{logo_filename}"
-    
-    # Check if file exists
-    if os.path.exists(logo_path):
-        return logo_path
-    return None
+    return _team_logo_paths().get(team_abbrev.upper())
+
+
+def injuries_by_player_id(sleeper_players: Dict[str, dict]) -> Dict[str, str]:
+    """Sleeper ID -> injury status for injured players only.
+
+    Built once per Sleeper players dump and kept in the session, so rendering
+    a card costs a single dict lookup.
+    """
+    cached = st.session_state.get("_injury_index")
+    if cached is None or cached[0] is not sleeper_players:
+        injuries = {
+            player_id: sp["injury_status"]
+            for player_id, sp in sleeper_players.items() if sp.get("injury_status")
+        }
+        cached = (sleeper_players, injuries)
+        st.session_state["_injury_index"] = cached
+    return cached[1]
 
 
-def format_player_rows(players: List[Player], sleeper_players: Dict[str, dict]) -> List[Dict[str, object]]:
+def format_player_rows(players: List[Player], injuries: Dict[str, str]) -> List[Dict[str, object]]:
     rows: List[Dict[str, object]] = []
     for player in players:
         row: Dict[str, object] = {
@@ -442,14 +484,163 @@ def format_player_rows(players: List[Player], sleeper_players: Dict[str, dict])
             "SOS": player.sos_season,
             "ECR vs ADP": player.ecr_vs_adp,
         }
-        if player.sleeper_id and player.sleeper_id in sleeper_players:
-            sp = sleeper_players[player.sleeper_id]
-            if sp.get("injury_status"):
-                row["Injury"] = sp.get("injury_status")
+        injury = injuries.get(player.sleeper_id)
+        if injury:
+            row["Injury"] = injury
         rows.append(row)
     return rows
 
 
+# (button label, index into the scraper's data, format name) per scoring format
+_RANKING_FORMATS = (
+    ("📊 Standard", 1, "Standard"),
+    ("📈 Half-PPR", 2, "Half-PPR"),
+    ("🏈 PPR", 3, "PPR"),
+)
+
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _scrape_fantasypros():
+    """One FantasyPros scrape holds every scoring format; share it across sessions."""
+    from fantasy_rankings_scraper import scrape
+    return scrape('fantasypros.com')
+
+
+def _load_rankings_format(data_index: int, format_name: str) -> None:
+    """Scrape FantasyPros rankings for one scoring format into a new draft tool."""
+    try:
+        with st.spinner(f"Loading {format_name} rankings..."):
+            scraper = _scrape_fantasypros()
+            players = scraper.data[data_index]
+            draft_tool = FantasyDraftTool("")
+            draft_tool.load_scraped_data(players, format_name)
+            draft_tool.fetch_sleeper_data()
+            draft_tool.match_players()
+            st.session_state.draft_tool = draft_tool
+            st.success(f"✅ Loaded {len(draft_tool.players)} {format_name} players successfully!")
+    except Exception as ex:
+        st.error(f"❌ Error loading {format_name} rankings: {ex}")
+
+
+# Sleeper lookups behind "Find my leagues"; reruns and repeat clicks within the
+# TTL reuse the responses instead of calling the API again
+SLEEPER_LOOKUP_TTL_SECONDS = 300
+
+
+class _EmptyLookup(Exception):
+    """Raised by a cached lookup that came back empty; st.cache_data doesn't cache exceptions."""
+
+
+@st.cache_data(ttl=SLEEPER_LOOKUP_TTL_SECONDS, show_spinner=False)
+def _cached_fetch_user_id(username: str) -> str:
+    user_id = FantasyDraftTool.fetch_user_id_by_username(username)
+    if not user_id:
+        raise _EmptyLookup(username)
+    return user_id
+
+
+@st.cache_data(ttl=SLEEPER_LOOKUP_TTL_SECONDS, show_spinner=False)
+def _cached_fetch_user_leagues(user_id: str, season_year: int) -> List[dict]:
+    leagues = FantasyDraftTool.fetch_user_leagues(user_id, season_year)
+    if not leagues:
+        raise _EmptyLookup(user_id)
+    return leagues
+
+
+@st.cache_data(ttl=SLEEPER_LOOKUP_TTL_SECONDS, show_spinner=False)
+def _cached_fetch_league_drafts(league_id: str) -> List[dict]:
+    return FantasyDraftTool.fetch_league_drafts(league_id)
+
+
+# League data behind the Weekly Rankings page. The Sleeper players dump is the
+# big one (several MB) and changes slowly, so it lives longer than league data
+SLEEPER_PLAYERS_TTL_SECONDS = 3600
+LEAGUE_DATA_TTL_SECONDS = 300
+
+
+# cache_resource hands every session the same dict instead of a per-call copy;
+# callers treat it as read-only
+@st.cache_resource(ttl=SLEEPER_PLAYERS_TTL_SECONDS, show_spinner=False)
+def _get_sleeper_players() -> Dict[str, dict]:
+    draft_tool = FantasyDraftTool("")
+    draft_tool.fetch_sleeper_data()
+    return draft_tool.sleeper_players
+
+
+@st.cache_data(ttl=LEAGUE_DATA_TTL_SECONDS, show_spinner=False)
+def _cached_fetch_league_bundle(league_id: str) -> Dict[str, List[dict]]:
+    league_bundle = FantasyDraftTool.fetch_league_bundle(league_id)
+    if not league_bundle['rosters'] or not league_bundle['users']:
+        raise _EmptyLookup(league_id)
+    return league_bundle
+
+
+@st.cache_data(ttl=LEAGUE_DATA_TTL_SECONDS, show_spinner=False)
+def _cached_league_roster_settings(league_id: str) -> Dict:
+    roster_settings = FantasyDraftTool.get_league_roster_settings(league_id)
+    if not roster_settings:
+        raise _EmptyLookup(league_id)
+    return roster_settings
+
+
+# Rankings CSVs are the same for every session; reload only when a file changes
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _shared_weekly_rankings(files_key: tuple) -> Dict[str, List[Dict]]:
+    return FantasyDraftTool.load_weekly_rankings()
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _shared_ros_rankings(files_key: tuple) -> List[Dict]:
+    return FantasyDraftTool.load_ros_rankings()
+
+
+# The analyzers are pure functions of the rosters, settings and rankings, so
+# reruns for the same league reuse their output. Underscore-prefixed arguments
+# are not hashed; the ID tuples, settings key and rankings files key stand in
+# for them
+@st.cache_data(ttl=LEAGUE_DATA_TTL_SECONDS, max_entries=50, show_spinner=False)
+def _cached_weekly_analysis(league_id: str, user_player_ids: tuple, all_league_players: tuple,
+                            settings_key: tuple, files_key: tuple,
+                            _weekly_rankings, _sleeper_players, _roster_settings) -> Dict:
+    # DEF / K matching only matters in leagues with those slots; settings_key
+    # already covers the roster settings these flags come from
+    return FantasyDraftTool.analyze_weekly_rankings(
+        _weekly_rankings, list(user_player_ids), _sleeper_players, _roster_settings,
+        list(all_league_players),
+        need_defenses=_roster_settings.get('DEF', 0) > 0,
+        need_kickers=_roster_settings.get('K', 0) > 0,
+    )
+
+
+@st.cache_data(ttl=LEAGUE_DATA_TTL_SECONDS, max_entries=50, show_spinner=False)
+def _cached_optimal_lineup(league_id: str, user_player_ids: tuple, all_league_players: tuple,
+                           settings_key: tuple, files_key: tuple,
+                           _weekly_rankings, _sleeper_players, _roster_settings,
+                           _current_analysis) -> Dict:
+    return FantasyDraftTool.analyze_optimal_lineup_with_free_agents(
+        _weekly_rankings, list(user_player_ids), _sleeper_players, _roster_settings,
+        list(all_league_players), current_analysis=_current_analysis,
+    )
+
+
+@st.cache_data(ttl=LEAGUE_DATA_TTL_SECONDS, max_entries=50, show_spinner=False)
+def _cached_ros_analysis(league_id: str, user_player_ids: tuple, all_league_players: tuple,
+                         files_key: tuple, _sleeper_players, _ros_rankings) -> Dict:
+    return FantasyDraftTool.analyze_ros_recommendations(
+        list(user_player_ids), _sleeper_players, list(all_league_players), _ros_rankings
+    )
+
+
+def _clear_weekly_data_caches() -> None:
+    """Drop cached Sleeper and league data so the next load fetches fresh copies."""
+    _get_sleeper_players.clear()
+    _cached_fetch_league_bundle.clear()
+    _cached_league_roster_settings.clear()
+    _cached_weekly_analysis.clear()
+    _cached_optimal_lineup.clear()
+    _cached_ros_analysis.clear()
+
+
 def render_sidebar() -> None:
     with st.sidebar:
         st.header("Setup")
@@ -459,50 +650,9 @@ def render_sidebar() -> None:
         st.markdown("Choose your scoring format:")
         
         # All three buttons vertically stacked
-        if st.button("📊 Standard", use_container_width=True):
-            try:
-                with st.spinner("Loading Standard rankings..."):
-                    from fantasy_rankings_scraper import scrape
-                    scraper = scrape('fantasypros.com')
-                    standard_players = scraper.data[1]
-                    draft_tool = FantasyDraftTool("")
-                    draft_tool.load_scraped_data(standard_players, "Standard")
-                    draft_tool.fetch_sleeper_data()
-                    draft_tool.match_players()
-                    st.session_state.draft_tool = draft_tool
-                    st.success(f"✅ Loaded {len(draft_tool.players)} Standard players successfully!")
-            except Exception as ex:
-                st.error(f"❌ Error loading Standard rankings: {ex}")
-        
-        if st.button("📈 Half-PPR", use_container_width=True):
-            try:
-                with st.spinner("Loading Half-PPR rankings..."):
-                    from fantasy_rankings_scraper import scrape
-                    scraper = scrape('fantasypros.com')
-                    half_ppr_players = scraper.data[2]
-                    draft_tool = FantasyDraftTool("")
-                    draft_tool.load_scraped_data(half_ppr_players, "Half-PPR")
-                    draft_tool.fetch_sleeper_data()
-                    draft_tool.match_players()
-                    st.session_state.draft_tool = draft_tool
-                    st.success(f"✅ Loaded {len(draft_tool.players)} Half-PPR players successfully!")
-            except Exception as ex:
-                st.error(f"❌ Error loading Half-PPR rankings: {ex}")
-        
-        if st.button("🏈 PPR", use_container_width=True):
-            try:
-                with st.spinner("Loading PPR rankings..."):
-                    from fantasy_rankings_scraper import scrape
-                    scraper = scrape('fantasypros.com')
-                    ppr_players = scraper.data[3]
-                    draft_tool = FantasyDraftTool("")
-                    draft_tool.load_scraped_data(ppr_players, "PPR")
-                    draft_tool.fetch_sleeper_data()
-                    draft_tool.match_players()
-                    st.session_state.draft_tool = draft_tool
-                    st.success(f"✅ Loaded {len(draft_tool.players)} PPR players successfully!")
-            except Exception as ex:
-                st.error(f"❌ Error loading PPR rankings: {ex}")
+        for label, data_index, format_name in _RANKING_FORMATS:
+            if st.button(label, use_container_width=True):
+                _load_rankings_format(data_index, format_name)
 
         st.divider()
 
@@ -519,21 +669,30 @@ def render_sidebar() -> None:
         
         if st.button("🔎 Find my leagues", use_container_width=True, disabled=not bool(username.strip())):
             with st.spinner("Fetching leagues and drafts..."):
-                user_id = FantasyDraftTool.fetch_user_id_by_username(username.strip())
+                # Failed lookups raise, so they aren't cached for the whole TTL
+                try:
+                    user_id = _cached_fetch_user_id(username.strip())
+                except _EmptyLookup:
+                    user_id = None
                 if not user_id:
                     st.error("❌ Could not resolve user_id from username.")
                 else:
-                    leagues = FantasyDraftTool.fetch_user_leagues(user_id, int(season_year))
+                    try:
+                        leagues = _cached_fetch_user_leagues(user_id, int(season_year))
+                    except _EmptyLookup:
+                        leagues = []
                     if not leagues:
                         st.warning("No leagues found for this season.")
                     else:
                         league_options = []
                         league_id_to_drafts: Dict[str, List[dict]] = {}
-                        for lg in leagues:
-                            league_id = lg.get("league_id")
+                        league_ids = [lg.get("league_id") for lg in leagues]
+                        # One drafts request per league; issue them concurrently
+                        with ThreadPoolExecutor(max_workers=min(8, len(league_ids))) as executor:
+                            drafts_per_league = list(executor.map(_cached_fetch_league_drafts, league_ids))
+                        for lg, league_id, drafts in zip(leagues, league_ids, drafts_per_league):
                             league_name = lg.get("name") or f"League {league_id}"
                             league_options.append((league_name, league_id))
-                            drafts = FantasyDraftTool.fetch_league_drafts(league_id)
                             league_id_to_drafts[league_id] = drafts
                         # Persist to session for subsequent interactions
                         st.session_state.username = username.strip()
@@ -575,7 +734,7 @@ def render_search(draft_tool: FantasyDraftTool) -> None:
     logo_path = get_team_logo_path(player.team)
     col_logo, col_name = st.columns([0.1, 0.9])
     with col_logo:
-        if logo_path and os.path.exists(logo_path):
+        if logo_path:
             try:
                 st.image(logo_path, width=50)
             except Exception:
@@ -606,76 +765,121 @@ def render_search(draft_tool: FantasyDraftTool) -> None:
             st.write("Injury Notes:", sp.get("injury_notes"))
 
 
+def player_line_html(player_name: str, team: str, position_display: str, rank: int, 
+                     roster_slot: str = None, waiver_indicator: str = "", 
+                     free_agent: bool = False, upgrade_info: str = None) -> str:
+    """Markup for a player line with team logo on the weekly rankings page."""
+    # Create the player text
+    slot_text = f"<strong>{escape(roster_slot)}</strong> " if roster_slot else ""
+    free_agent_text = " ✨ FREE AGENT" if free_agent else ""
+    player_text = (
+        f"{slot_text}<strong>{escape(str(player_name))}</strong> ({escape(str(position_display))}) - {escape(str(team))} - "
+        f"<strong>Rank #{rank}</strong>{escape(waiver_indicator)}{free_agent_text}"
+    )
+    caption_html = f"<div class='player-row-caption'>{escape(upgrade_info)}</div>" if upgrade_info else ""
+    return _player_row_html(team, player_text + caption_html)
+
+
 def render_player_with_logo(player_name: str, team: str, position_display: str, rank: int, 
                             roster_slot: str = None, waiver_indicator: str = "", 
                             free_agent: bool = False, upgrade_info: str = None) -> None:
     """Render a player line with team logo for weekly rankings page."""
+    # Logo and text go out as a single element rather than two columns and an image
+    st.markdown(
+        player_line_html(player_name, team, position_display, rank, roster_slot,
+                         waiver_indicator, free_agent, upgrade_info),
+        unsafe_allow_html=True,
+    )
+
+
+# Every flex variant is labelled plain FLEX in the lineup
+_FLEX_SLOTS = frozenset({'SUPER_FLEX', 'FLEX', 'WRRBTE_FLEX', 'WRRB_FLEX'})
+
+
+def _roster_slot_label(player: Dict) -> str:
+    """Lineup slot label for an analyzed starter."""
+    roster_slot = player.get('flex_slot', player['position'])
+    return 'FLEX' if roster_slot in _FLEX_SLOTS else roster_slot
+
+
+def render_player_lines(lines: List[str]) -> None:
+    """Render several player_line_html() rows as a single markdown element."""
+    st.markdown("".join(lines), unsafe_allow_html=True)
+
+
+def _player_row_html(team: str, body_html: str) -> str:
+    """One logo-and-text row; an empty logo box keeps rows without a logo aligned."""
+    logo_html = _logo_img_html(team) or "<div class='player-logo-container'></div>"
+    return f"<div class='player-row'>{logo_html}<div>{body_html}</div></div>"
+
+
+def render_player_rows(rows: List[Tuple[str, str]]) -> None:
+    """Render (team, body_html) pairs as logo rows in a single markdown element."""
+    render_player_lines([_player_row_html(team, body_html) for team, body_html in rows])
+
+
+@st.cache_data(max_entries=40)
+def _logo_img_html(team: str) -> str:
+    """Inline base64 logo markup for a player card, or "" when there is no logo."""
     logo_path = get_team_logo_path(team)
-    
-    # Create the player text
-    slot_text = f"**{roster_slot}** " if roster_slot else ""
-    free_agent_text = " ✨ FREE AGENT" if free_agent else ""
-    player_text = f"{slot_text}**{player_name}** ({position_display}) - {team} - **Rank #{rank}**{waiver_indicator}{free_agent_text}"
-    
-    # Use columns to display logo and text
-    col1, col2 = st.columns([0.08, 0.92])
-    with col1:
-        if logo_path and os.path.exists(logo_path):
-            try:
-                st.image(logo_path, width=30)
-            except Exception:
-                st.write("")
-        else:
-            st.write("")
-    with col2:
-        st.markdown(player_text)
-        if upgrade_info:
-            st.caption(upgrade_info)
+    if not logo_path:
+        return ""
+    try:
+        with open(logo_path, "rb") as img_file:
+            img_data = base64.b64encode(img_file.read()).decode()
+    except Exception:
+        return ""
+    return f'<div class="player-logo-container"><img src="data:image/png;base64,{img_data}" class="player-logo" alt="{team}" /></div>'
 
 
-def render_player_card(player: Player, sleeper_players: Dict[str, dict], index: int = None) -> None:
-    injury = None
-    if player.sleeper_id and player.sleeper_id in sleeper_players:
-        sp = sleeper_players[player.sleeper_id]
-        injury = sp.get("injury_status")
+# Player card markup, filled in one format_map pass. Kept on one line: blank or
+# deeply indented lines would end the HTML block when several cards are joined
+# into one markdown element
+_CARD_TEMPLATE = (
+    '<div class="player-card">{logo_html}<div class="player-content">'
+    '<div class="player-name">{num_html}{name}<span class="player-team">({team})</span></div>'
+    '<div class="player-meta">'
+    '<span class="badge">Overall #{overall_rank}</span> '
+    '<span class="badge">{position} #{position_rank}</span> '
+    '<span class="badge">Tier {tier}</span> '
+    '<span class="badge">Bye {bye_week}</span> '
+    '<span class="badge">SOS {sos_season}</span> '
+    '<span class="badge">ECR vs ADP {ecr_vs_adp:+d}</span>'
+    '</div>{injury_html}</div></div>'
+)
 
+
+@st.cache_data(max_entries=1000)
+def _player_card_html(name: str, team: str, overall_rank: int, position: str, position_rank: int,
+                      tier: int, bye_week: int, sos_season: str, ecr_vs_adp: int,
+                      injury: Optional[str], index: Optional[int]) -> str:
+    """Player card markup; cached on the displayed fields so reruns skip the formatting."""
     num_html = f"<span class='num-badge'>{index}.</span>" if index is not None else ""
     injury_html = f"<div class='player-injury'>Injury: {injury}</div>" if injury else ""
+    logo_html = _logo_img_html(team)
     
-    # Get team logo path
-    logo_path = get_team_logo_path(player.team)
-    
-    # Create logo HTML if logo exists
-    logo_html = ""
-    if logo_path and os.path.exists(logo_path):
-        try:
-            import base64
-            with open(logo_path, "rb") as img_file:
-                img_data = base64.b64encode(img_file.read()).decode()
-                logo_html = f'<div class="player-logo-container"><img src="data:image/png;base64,{img_data}" class="player-logo" alt="{player.team}" /></div>'
-        except Exception:
-            logo_html = ""
-    
-    # Display player card with logo
-    st.markdown(
-        f"""
-        <div class="player-card">
-          {logo_html}
-          <div class="player-content">
-            <div class="player-name">{num_html}{player.name}<span class="player-team">({player.team})</span></div>
-            <div class="player-meta">
-              <span class="badge">Overall #{player.overall_rank}</span>
-              <span class="badge">{player.position} #{player.position_rank}</span>
-              <span class="badge">Tier {player.tier}</span>
-              <span class="badge">Bye {player.bye_week}</span>
-              <span class="badge">SOS {player.sos_season}</span>
-              <span class="badge">ECR vs ADP {player.ecr_vs_adp:+d}</span>
-            </div>
-            {injury_html}
-          </div>
-        </div>
-        """,
-        unsafe_allow_html=True,
+    return _CARD_TEMPLATE.format_map({
+        "logo_html": logo_html,
+        "num_html": num_html,
+        "name": name,
+        "team": team,
+        "overall_rank": overall_rank,
+        "position": position,
+        "position_rank": position_rank,
+        "tier": tier,
+        "bye_week": bye_week,
+        "sos_season": sos_season,
+        "ecr_vs_adp": ecr_vs_adp,
+        "injury_html": injury_html,
+    })
+
+
+def player_card_html(player: Player, injuries: Dict[str, str], index: int = None) -> str:
+    """Markup for one player card with logo; callers batch cards into one st.markdown."""
+    return _player_card_html(
+        player.name, player.team, player.overall_rank, player.position, player.position_rank,
+        player.tier, player.bye_week, player.sos_season, player.ecr_vs_adp,
+        injuries.get(player.sleeper_id), index,
     )
 
 
@@ -683,19 +887,21 @@ def render_top_by_position(draft_tool: FantasyDraftTool) -> None:
     st.markdown("### Top 3 By Position (Available)")
     positions = ["RB", "WR", "QB", "TE"]
 
-    # Arrange positions in two columns for readability
-    for i in range(0, len(positions), 2):
-        row_positions = positions[i : i + 2]
-        cols = st.columns(len(row_positions))
-        for col_idx, pos in enumerate(row_positions):
-            with cols[col_idx]:
-                st.markdown(f"<div class='pos-header'>{pos}</div>", unsafe_allow_html=True)
-                top_players = draft_tool.get_top_players_by_position(pos, 3)
-                if not top_players:
-                    st.write("No players available.")
-                    continue
-                for idx, p in enumerate(top_players, start=1):
-                    render_player_card(p, draft_tool.sleeper_players, idx)
+    injuries = injuries_by_player_id(draft_tool.sleeper_players)
+
+    # Lay positions out two per row with a CSS grid, sent as one element
+    sections = []
+    for pos in positions:
+        top_players = draft_tool.get_top_players_by_position(pos, 3)
+        if top_players:
+            body = "".join(
+                player_card_html(p, injuries, idx)
+                for idx, p in enumerate(top_players, start=1)
+            )
+        else:
+            body = "<p>No players available.</p>"
+        sections.append(f"<div><div class='pos-header'>{pos}</div>{body}</div>")
+    st.markdown(f"<div class='pos-grid'>{''.join(sections)}</div>", unsafe_allow_html=True)
 
 
 def render_top_overall(draft_tool: FantasyDraftTool) -> None:
@@ -706,8 +912,13 @@ def render_top_overall(draft_tool: FantasyDraftTool) -> None:
         show_10 = st.toggle("Show top 10 (otherwise top 5)", value=False)
     limit = 10 if show_10 else 5
     players = draft_tool.get_top_overall_available(limit)
-    for idx, p in enumerate(players, start=1):
-        render_player_card(p, draft_tool.sleeper_players, idx)
+    injuries = injuries_by_player_id(draft_tool.sleeper_players)
+    cards = [
+        player_card_html(p, injuries, idx)
+        for idx, p in enumerate(players, start=1)
+    ]
+    if cards:
+        st.markdown("".join(cards), unsafe_allow_html=True)
 
 
 def render_navigation() -> None:
@@ -746,11 +957,18 @@ def render_weekly_rankings_sidebar() -> None:
         
         if st.button("🔎 Find my leagues", use_container_width=True, disabled=not bool(username.strip()), key="weekly_find_leagues"):
             with st.spinner("Fetching leagues..."):
-                user_id = FantasyDraftTool.fetch_user_id_by_username(username.strip())
+                # Failed lookups raise, so they aren't cached for the whole TTL
+                try:
+                    user_id = _cached_fetch_user_id(username.strip())
+                except _EmptyLookup:
+                    user_id = None
                 if not user_id:
                     st.error("❌ Could not resolve user_id from username.")
                 else:
-                    leagues = FantasyDraftTool.fetch_user_leagues(user_id, int(season_year))
+                    try:
+                        leagues = _cached_fetch_user_leagues(user_id, int(season_year))
+                    except _EmptyLookup:
+                        leagues = []
                     if not leagues:
                         st.warning("No leagues found for this season.")
                     else:
@@ -769,8 +987,106 @@ def render_weekly_rankings_sidebar() -> None:
             st.markdown("**Your Leagues (click to analyze):**")
             for league_name, league_id in st.session_state.weekly_discovered_leagues:
                 if st.button(f"🏈 {league_name}", key=f"weekly_league_{league_id}", use_container_width=True):
-                    st.session_state.selected_weekly_league = (league_name, league_id)
-                    st.rerun()
+                    # The URL holds the selection, so it survives reloads and can be shared.
+                    # The content renders after the sidebar in this same run; no st.rerun()
+                    st.query_params.update(
+                        league_id=league_id,
+                        league_name=league_name,
+                        user_id=st.session_state.weekly_user_id,
+                    )
+
+
+@st.fragment
+def render_ros_recommendations(league_id: str, user_ids_key: tuple, league_ids_key: tuple,
+                               rankings_key: tuple, sleeper_players: Dict[str, dict]) -> None:
+    """ROS section of the Weekly Rankings page, loaded only once the user asks for it.
+
+    As a fragment, flipping the toggle reruns just this section.
+    """
+    if not st.toggle("Show ROS upgrade recommendations", key="weekly_show_ros"):
+        return
+    
+    # Load and analyze ROS rankings
+    with st.spinner("Analyzing ROS upgrade opportunities..."):
+        ros_rankings = _shared_ros_rankings(rankings_key)
+    
+    if ros_rankings:
+        ros_analysis = _cached_ros_analysis(
+            league_id, user_ids_key, league_ids_key, rankings_key, sleeper_players, ros_rankings
+        )
+        
+        # Create horizontal split for ROS recommendations
+        ros_col1, ros_col2 = st.columns([1, 1])  # Equal width columns
+        
+        with ros_col1:
+            st.markdown("**📍 Position-Specific Upgrades**")
+            
+            positions = ['QB', 'RB', 'WR', 'TE']
+            position_emojis = {'QB': '🎯', 'RB': '🏈', 'WR': '⚡', 'TE': '🎪'}
+            
+            for position in positions:
+                recommendations = ros_analysis['position_recommendations'].get(position, [])
+                
+                st.markdown(f"**{position_emojis.get(position, '🏈')} {position}S**")
+                
+                if recommendations:
+                    for rec in recommendations:
+                        drop_player = rec['drop']
+                        add_player = rec['add']
+                        improvement = rec['improvement']
+                        
+                        st.markdown("**Drop:**")
+                        render_player_with_logo(
+                            drop_player['name'],
+                            drop_player.get('team', ''),
+                            drop_player['position_with_rank'],
+                            drop_player['rank']
+                        )
+                        st.markdown("**Add:**")
+                        render_player_with_logo(
+                            add_player['name'],
+                            add_player.get('team', ''),
+                            add_player['position_with_rank'],
+                            add_player['rank']
+                        )
+                        st.success(f"⬆️ Improvement: +{improvement} ranks")
+                        st.write("")  # Spacing
+                else:
+                    st.info("No upgrades available")
+                    st.write("")  # Spacing
+        
+        with ros_col2:
+            st.markdown("**📈 Best Available Players**")
+            
+            # Worst drops section first
+            st.markdown("**➖ DROP (Worst on Roster)**")
+            if ros_analysis['worst_drops']:
+                # Best 8 by rank, formatted as: **{position}** Rank #{rank} - {name} ({team})
+                top_drops = heapq.nsmallest(8, ros_analysis['worst_drops'], key=lambda x: x['rank'])
+                render_player_rows([
+                    (player['team'],
+                     f"<strong>{escape(str(player['position']))}</strong> Rank #{player['rank']} - {escape(str(player['name']))} ({escape(str(player['team']))})")
+                    for player in top_drops
+                ])
+            else:
+                st.info("No players to drop")
+            
+            st.write("")  # Spacing
+            
+            # Best adds section
+            st.markdown("**➕ ADD (Best Available)**")
+            if ros_analysis['best_adds']:
+                # Best 8 by rank, formatted as: **{position}** Rank #{rank} - {name} ({team})
+                top_adds = heapq.nsmallest(8, ros_analysis['best_adds'], key=lambda x: x['rank'])
+                render_player_rows([
+                    (player['team'],
+                     f"<strong>{escape(str(player['position']))}</strong> Rank #{player['rank']} - {escape(str(player['name']))} ({escape(str(player['team']))})")
+                    for player in top_adds
+                ])
+            else:
+                st.info("No free agents found")
+    else:
+        st.info("📁 No ROS rankings file found. Add FantasyPros_*_Ros_ALL_Rankings.csv to the weekly_rankings folder.")
 
 
 def render_weekly_rankings_content() -> None:
@@ -778,26 +1094,48 @@ def render_weekly_rankings_content() -> None:
     st.markdown('<div class="app-title">Weekly Rankings</div>', unsafe_allow_html=True)
     st.markdown('<div class="app-caption">Get start/sit recommendations and waiver wire suggestions for your leagues.</div>', unsafe_allow_html=True)
     
-    # Show analysis for selected league
-    if "selected_weekly_league" in st.session_state:
-        league_name, league_id = st.session_state.selected_weekly_league
+    # Show analysis for the league selected in the URL
+    league_id = st.query_params.get("league_id")
+    user_id = st.query_params.get("user_id") or st.session_state.get("weekly_user_id")
+    if league_id and user_id:
+        league_name = st.query_params.get("league_name") or f"League {league_id}"
         st.markdown(f"### Analyzing: {league_name}")
         
-        # Load weekly rankings
-        with st.spinner("Loading weekly rankings..."):
-            weekly_rankings = FantasyDraftTool.load_weekly_rankings()
-        
-        if not weekly_rankings:
-            st.error("❌ No weekly rankings files found in weekly_rankings folder.")
-            st.info("Please add your weekly rankings CSV files to the weekly_rankings folder.")
-            return
+        # Sleeper and league data are cached; this is the escape hatch for fresh copies
+        if st.button("🔄 Refresh data", key="weekly_refresh_data"):
+            _clear_weekly_data_caches()
         
-        
-        # Load league data
-        with st.spinner("Loading league data..."):
+        # One status box reports each loading step instead of a spinner per step.
+        # Error messages below are written outside it, so they stay visible
+        status = st.status("Loading league...", expanded=False)
+        loaded = False
+        try:
+            # Load weekly rankings
+            rankings_key = FantasyDraftTool.get_weekly_rankings_files_key()
+            status.update(label="Loading weekly rankings...")
+            weekly_rankings = _shared_weekly_rankings(rankings_key)
+            
+            if not weekly_rankings:
+                st.error("❌ No weekly rankings files found in weekly_rankings folder.")
+                st.info("Please add your weekly rankings CSV files to the weekly_rankings folder.")
+                return
+            
+            
+            # League data, Sleeper players and roster settings are independent;
+            # fetch them concurrently so the wait is the slowest one, not the sum.
+            # shutdown(wait=False) lets the error paths below return as soon as the
+            # rosters are checked; the other downloads finish into their caches
+            executor = ThreadPoolExecutor(max_workers=3)
+            bundle_future = executor.submit(_cached_fetch_league_bundle, league_id)
+            players_future = executor.submit(_get_sleeper_players)
+            settings_future = executor.submit(_cached_league_roster_settings, league_id)
+            executor.shutdown(wait=False)
+            
+            status.update(label="Loading league data...")
             try:
-                rosters = FantasyDraftTool.fetch_league_rosters(league_id)
-                users = FantasyDraftTool.fetch_league_users(league_id)
+                league_bundle = bundle_future.result()
+                rosters = league_bundle['rosters']
+                users = league_bundle['users']
                 
                 # Additional validation for chopped leagues
                 if not isinstance(rosters, list):
@@ -806,73 +1144,78 @@ def render_weekly_rankings_content() -> None:
                 if not isinstance(users, list):
                     st.error("❌ Invalid user data format for this league type.")
                     return
-                    
+            
+            except _EmptyLookup:
+                # Not cached, so the next run tries again
+                rosters = users = []
             except Exception as e:
                 st.error(f"❌ Error loading league data: {str(e)}")
                 return
             
-        # Get Sleeper players data (always fetch fresh to avoid caching issues)
-        with st.spinner("Loading fresh player data..."):
-            draft_tool = FantasyDraftTool("")
-            draft_tool.fetch_sleeper_data()
-            sleeper_players = draft_tool.sleeper_players
-        
-        if not rosters or not users:
-            st.error("❌ Could not load league data.")
-            return
-        
-        # Find user's roster
-        user_id = st.session_state.weekly_user_id
-        user_roster = None
-        for roster in rosters:
-            # Handle different roster structures (normal vs chopped leagues)
-            if not isinstance(roster, dict):
-                continue
-            if roster.get('owner_id') == user_id:
-                user_roster = roster
-                break
-        
-        if not user_roster:
-            st.error("❌ Could not find your roster in this league.")
-            return
-        
-        # Get user's players
-        user_player_ids = user_roster.get('players', [])
-        # Handle case where players might not be a list
-        if not isinstance(user_player_ids, list):
-            st.error("❌ Invalid roster structure for this league type.")
-            return
-        if not user_player_ids:
-            st.warning("⚠️ Your roster appears to be empty.")
-            return
-        
-        
-        # Get league roster settings
-        with st.spinner("Loading league settings..."):
-            roster_settings = FantasyDraftTool.get_league_roster_settings(league_id)
-        
-        # Get all league rosters to check availability
-        with st.spinner("Loading all league rosters..."):
-            all_rosters = FantasyDraftTool.fetch_league_rosters(league_id)
-            all_league_players = []
-            for roster in all_rosters:
-                # Handle different roster structures (normal vs chopped leagues)
-                if not isinstance(roster, dict):
-                    continue
-                
-                players = roster.get('players', [])
-                # Handle case where players might not be a list
-                if not isinstance(players, list):
-                    continue
-                    
-                for player_id in players:
-                    if player_id:  # Skip None/empty player IDs
-                        all_league_players.append({'player_id': player_id})
-        
-        # Analyze weekly rankings
-        with st.spinner("Analyzing weekly rankings..."):
-            user_players_list = [{'player_id': pid} for pid in user_player_ids]
-            analysis = FantasyDraftTool.analyze_weekly_rankings(weekly_rankings, user_players_list, sleeper_players, roster_settings, all_league_players)
+            if not rosters or not users:
+                st.error("❌ Could not load league data.")
+                return
+            
+            # Find user's roster (skipping entries that aren't dicts in chopped leagues)
+            rosters_by_owner = {r['owner_id']: r for r in rosters if isinstance(r, dict) and 'owner_id' in r}
+            user_roster = rosters_by_owner.get(user_id)
+            
+            if not user_roster:
+                st.error("❌ Could not find your roster in this league.")
+                return
+            
+            # Get user's players
+            user_player_ids = user_roster.get('players', [])
+            # Handle case where players might not be a list
+            if not isinstance(user_player_ids, list):
+                st.error("❌ Invalid roster structure for this league type.")
+                return
+            if not user_player_ids:
+                st.warning("⚠️ Your roster appears to be empty.")
+                return
+            
+            status.update(label="Loading player data...")
+            sleeper_players = players_future.result()
+            try:
+                roster_settings = settings_future.result()
+            except _EmptyLookup:
+                roster_settings = {}
+            
+            # Sleeper players are cached; "Refresh data" fetches a fresh copy
+            if not sleeper_players:
+                # Don't keep a failed download around for the whole TTL, and don't
+                # let the analysis caches below store results built without it
+                _get_sleeper_players.clear()
+                st.error("❌ Could not load Sleeper player data. Please try again.")
+                return
+            
+            # Every rostered player in the league, from the rosters loaded above
+            all_league_players = FantasyDraftTool.collect_league_player_ids(rosters)
+            
+            # Cache keys for the analysis results below
+            user_ids_key = tuple(user_player_ids)
+            league_ids_key = tuple(all_league_players)
+            settings_key = tuple(sorted(roster_settings.items())) if isinstance(roster_settings, dict) else ()
+            
+            # Analyze weekly rankings
+            status.update(label="Analyzing weekly rankings...")
+            analysis = _cached_weekly_analysis(
+                league_id, user_ids_key, league_ids_key, settings_key, rankings_key,
+                weekly_rankings, sleeper_players, roster_settings,
+            )
+            
+            # Compare the roster against the best available free agents
+            status.update(label="Analyzing optimal lineup with free agents...")
+            optimal_analysis = _cached_optimal_lineup(
+                league_id, user_ids_key, league_ids_key, settings_key, rankings_key,
+                weekly_rankings, sleeper_players, roster_settings, analysis,
+            )
+            loaded = True
+        finally:
+            if loaded:
+                status.update(label="League loaded", state="complete")
+            else:
+                status.update(label="Could not load league", state="error")
         
         # Show league settings
         if roster_settings:
@@ -883,6 +1226,10 @@ def render_weekly_rankings_content() -> None:
         # Show Start/Sit Recommendations
         st.markdown("#### 🎯 Start/Sit Recommendations")
         
+        # Check if defenses and kickers are required in this league
+        dst_required = roster_settings.get('DEF', 0) > 0
+        k_required = roster_settings.get('K', 0) > 0
+        
         # Create horizontal split layout
         col1, col2 = st.columns([2, 1])  # Left column wider than right
         
@@ -890,72 +1237,54 @@ def render_weekly_rankings_content() -> None:
             # Starting Lineup
             if analysis['starters']:
                 st.markdown("**✅ RECOMMENDED STARTING LINEUP:**")
-                for player in analysis['starters']:
-                    position_display = player.get('position_with_rank', player['position'])
-                    waiver_indicator = " (Free Agent)" if player.get('is_waiver_wire', False) else ""
-                    
-                    # Determine the roster slot label
-                    roster_slot = player.get('flex_slot', player['position'])
-                    if roster_slot in ['SUPER_FLEX', 'FLEX', 'WRRBTE_FLEX', 'WRRB_FLEX']:
-                        roster_slot = 'FLEX'
-                    
-                    render_player_with_logo(
+                render_player_lines([
+                    player_line_html(
                         player['name'], 
                         player['team'], 
-                        position_display, 
+                        player.get('position_with_rank', player['position']), 
                         player['rank'],
-                        roster_slot=roster_slot,
-                        waiver_indicator=waiver_indicator
+                        roster_slot=_roster_slot_label(player),
+                        waiver_indicator=" (Free Agent)" if player.get('is_waiver_wire', False) else ""
                     )
+                    for player in analysis['starters']
+                ])
             else:
                 st.warning("No starting lineup recommendations available.")
             
             # Bench Players
             if analysis['bench']:
                 st.markdown("**🪑 BENCH PLAYERS:**")
-                for player in analysis['bench']:
-                    position_display = player.get('position_with_rank', player['position'])
-                    render_player_with_logo(
+                render_player_lines([
+                    player_line_html(
                         player['name'],
                         player['team'],
-                        position_display,
+                        player.get('position_with_rank', player['position']),
                         player['rank'],
                         roster_slot='BN'
                     )
+                    for player in analysis['bench']
+                ])
             else:
                 st.info("No bench players.")
             
-            # Check if defenses and kickers are required in this league
-            dst_required = roster_settings.get('DEF', 0) > 0
-            k_required = roster_settings.get('K', 0) > 0
-            
             # Defenses (if not in starting lineup and position is required)
             if dst_required and analysis['defenses'] and len(analysis['defenses']) > 1:
                 st.markdown("**🛡️ OTHER DEFENSES ON ROSTER:**")
-                for i, defense in enumerate(analysis['defenses'][1:], 1):  # Skip first one (already in lineup)
-                    render_player_with_logo(
-                        defense['name'],
-                        defense.get('team', ''),
-                        'DEF',
-                        defense['rank']
-                    )
+                render_player_lines([
+                    player_line_html(defense['name'], defense.get('team', ''), 'DEF', defense['rank'])
+                    for defense in analysis['defenses'][1:]  # Skip first one (already in lineup)
+                ])
             
             # Kickers (if not in starting lineup and position is required)
             if k_required and analysis['kickers'] and len(analysis['kickers']) > 1:
                 st.markdown("**🦵 OTHER KICKERS ON ROSTER:**")
-                for i, kicker in enumerate(analysis['kickers'][1:], 1):  # Skip first one (already in lineup)
-                    render_player_with_logo(
-                        kicker['name'],
-                        kicker['team'],
-                        'K',
-                        kicker['rank']
-                    )
+                render_player_lines([
+                    player_line_html(kicker['name'], kicker['team'], 'K', kicker['rank'])
+                    for kicker in analysis['kickers'][1:]  # Skip first one (already in lineup)
+                ])
         
         with col2:
             # Waiver Wire Suggestions - only show if the positions are required in the league
-            dst_required = roster_settings.get('DEF', 0) > 0
-            k_required = roster_settings.get('K', 0) > 0
-            
             if dst_required or k_required:
                 st.markdown("**💡 Waiver Wire Suggestions**")
                 
@@ -963,15 +1292,16 @@ def render_weekly_rankings_content() -> None:
                 if dst_required:
                     if analysis['waiver_suggestions']['defenses']:
                         st.markdown("**Top 5 Defenses:**")
-                        for i, defense in enumerate(analysis['waiver_suggestions']['defenses'][:5], 1):
-                            status = "On Your Roster" if defense.get('is_on_roster', False) else "Free Agent"
-                            render_player_with_logo(
+                        render_player_lines([
+                            player_line_html(
                                 defense['name'],
                                 defense.get('team', ''),
                                 'DEF',
                                 defense['rank'],
-                                waiver_indicator=f" ({status})"
+                                waiver_indicator=" (On Your Roster)" if defense.get('is_on_roster', False) else " (Free Agent)"
                             )
+                            for defense in analysis['waiver_suggestions']['defenses'][:5]
+                        ])
                     else:
                         st.info("No defense suggestions available.")
                 
@@ -979,15 +1309,16 @@ def render_weekly_rankings_content() -> None:
                 if k_required:
                     if analysis['waiver_suggestions']['kickers']:
                         st.markdown("**Top 5 Kickers:**")
-                        for i, kicker in enumerate(analysis['waiver_suggestions']['kickers'][:5], 1):
-                            status = "On Your Roster" if kicker.get('is_on_roster', False) else "Free Agent"
-                            render_player_with_logo(
+                        render_player_lines([
+                            player_line_html(
                                 kicker['name'],
                                 kicker['team'],
                                 'K',
                                 kicker['rank'],
-                                waiver_indicator=f" ({status})"
+                                waiver_indicator=" (On Your Roster)" if kicker.get('is_on_roster', False) else " (Free Agent)"
                             )
+                            for kicker in analysis['waiver_suggestions']['kickers'][:5]
+                        ])
                     else:
                         st.info("No kicker suggestions available.")
         
@@ -995,26 +1326,14 @@ def render_weekly_rankings_content() -> None:
         st.markdown("---")  # Separator line
         st.markdown("#### ⭐ Optimal Starting Lineup with Free Agent Analysis")
         
-        # Load and analyze weekly rankings for free agent comparisons
-        with st.spinner("Analyzing optimal lineup with free agents..."):
-            weekly_rankings = FantasyDraftTool.load_weekly_rankings()
-        
         if weekly_rankings:
-            # Create optimal lineup analysis that compares roster players vs free agents
-            optimal_analysis = FantasyDraftTool.analyze_optimal_lineup_with_free_agents(
-                weekly_rankings, user_players_list, sleeper_players, roster_settings, all_league_players
-            )
-            
             if optimal_analysis['optimal_starters']:
                 st.markdown("**🎯 OPTIMAL STARTING LINEUP (Including Best Available Free Agents):**")
                 
+                lines = []
                 for player in optimal_analysis['optimal_starters']:
                     position_display = player.get('position_with_rank', player['position'])
-                    
-                    # Determine the roster slot label
-                    roster_slot = player.get('flex_slot', player['position'])
-                    if roster_slot in ['SUPER_FLEX', 'FLEX', 'WRRBTE_FLEX', 'WRRB_FLEX']:
-                        roster_slot = 'FLEX'
+                    roster_slot = _roster_slot_label(player)
                     
                     # Check if this is a free agent recommendation
                     if player.get('is_free_agent', False):
@@ -1022,7 +1341,7 @@ def render_weekly_rankings_content() -> None:
                         upgrade_info = None
                         if current_player:
                             upgrade_info = f"   ↳ Upgrade from: {current_player['name']} (Rank #{current_player['rank']}) - Improvement: +{current_player['rank'] - player['rank']} ranks"
-                            render_player_with_logo(
+                            lines.append(player_line_html(
                                 f"🔄 {player['name']}",
                                 player['team'],
                                 position_display,
@@ -1030,24 +1349,25 @@ def render_weekly_rankings_content() -> None:
                                 roster_slot=roster_slot,
                                 free_agent=True,
                                 upgrade_info=upgrade_info
-                            )
+                            ))
                         else:
-                            render_player_with_logo(
+                            lines.append(player_line_html(
                                 player['name'],
                                 player['team'],
                                 position_display,
                                 player['rank'],
                                 roster_slot=roster_slot,
                                 free_agent=True
-                            )
+                            ))
                     else:
-                        render_player_with_logo(
+                        lines.append(player_line_html(
                             player['name'],
                             player['team'],
                             position_display,
                             player['rank'],
                             roster_slot=roster_slot
-                        )
+                        ))
+                render_player_lines(lines)
                 
                 # Show summary of potential improvements
                 if optimal_analysis['free_agent_upgrades']:
@@ -1055,21 +1375,13 @@ def render_weekly_rankings_content() -> None:
                     total_improvement = sum(upgrade['improvement'] for upgrade in optimal_analysis['free_agent_upgrades'])
                     st.success(f"🚀 **{len(optimal_analysis['free_agent_upgrades'])} potential upgrade(s)** with **+{total_improvement} total rank improvement**")
                     
-                    for upgrade in optimal_analysis['free_agent_upgrades']:
-                        # Display upgrade with logos
-                        col1, col2 = st.columns([0.08, 0.92])
-                        with col1:
-                            # Show logo for the add player
-                            add_logo = get_team_logo_path(upgrade['add'].get('team', ''))
-                            if add_logo and os.path.exists(add_logo):
-                                try:
-                                    st.image(add_logo, width=25)
-                                except Exception:
-                                    st.write("")
-                            else:
-                                st.write("")
-                        with col2:
-                            st.write(f"• **{upgrade['position']}**: {upgrade['add']['name']} (#{upgrade['add']['rank']}) replaces {upgrade['drop']['name']} (#{upgrade['drop']['rank']}) - **+{upgrade['improvement']} ranks**")
+                    # Each upgrade shows the logo of the player to add
+                    render_player_rows([
+                        (upgrade['add'].get('team', ''),
+                         f"• <strong>{escape(str(upgrade['position']))}</strong>: {escape(str(upgrade['add']['name']))} (#{upgrade['add']['rank']}) "
+                         f"replaces {escape(str(upgrade['drop']['name']))} (#{upgrade['drop']['rank']}) - <strong>+{upgrade['improvement']} ranks</strong>")
+                        for upgrade in optimal_analysis['free_agent_upgrades']
+                    ])
                 else:
                     st.info("✅ Your current starting lineup is already optimal - no better free agents available!")
             else:
@@ -1081,105 +1393,9 @@ def render_weekly_rankings_content() -> None:
         st.markdown("---")  # Separator line
         st.markdown("#### 🔄 ROS Upgrade Recommendations")
         
-        # Load and analyze ROS rankings
-        with st.spinner("Analyzing ROS upgrade opportunities..."):
-            ros_rankings = FantasyDraftTool.load_ros_rankings()
-        
-        if ros_rankings:
-            ros_analysis = FantasyDraftTool.analyze_ros_recommendations(
-                user_players_list, sleeper_players, all_league_players, ros_rankings
-            )
-            
-            # Create horizontal split for ROS recommendations
-            ros_col1, ros_col2 = st.columns([1, 1])  # Equal width columns
-            
-            with ros_col1:
-                st.markdown("**📍 Position-Specific Upgrades**")
-                
-                positions = ['QB', 'RB', 'WR', 'TE']
-                position_emojis = {'QB': '🎯', 'RB': '🏈', 'WR': '⚡', 'TE': '🎪'}
-                
-                for position in positions:
-                    recommendations = ros_analysis['position_recommendations'].get(position, [])
-                    
-                    st.markdown(f"**{position_emojis.get(position, '🏈')} {position}S**")
-                    
-                    if recommendations:
-                        for rec in recommendations:
-                            drop_player = rec['drop']
-                            add_player = rec['add']
-                            improvement = rec['improvement']
-                            
-                            st.markdown("**Drop:**")
-                            render_player_with_logo(
-                                drop_player['name'],
-                                drop_player.get('team', ''),
-                                drop_player['position_with_rank'],
-                                drop_player['rank']
-                            )
-                            st.markdown("**Add:**")
-                            render_player_with_logo(
-                                add_player['name'],
-                                add_player.get('team', ''),
-                                add_player['position_with_rank'],
-                                add_player['rank']
-                            )
-                            st.success(f"⬆️ Improvement: +{improvement} ranks")
-                            st.write("")  # Spacing
-                    else:
-                        st.info("No upgrades available")
-                        st.write("")  # Spacing
-            
-            with ros_col2:
-                st.markdown("**📈 Best Available Players**")
-                
-                # Worst drops section first
-                st.markdown("**➖ DROP (Worst on Roster)**")
-                if ros_analysis['worst_drops']:
-                    # Sort by rank (best ranks first)
-                    sorted_drops = sorted(ros_analysis['worst_drops'], key=lambda x: x['rank'])
-                    for player in sorted_drops[:8]:  # Top 8
-                        # Format: **{position}** Rank #{rank} - {name} ({team})
-                        col1, col2 = st.columns([0.08, 0.92])
-                        with col1:
-                            logo_path = get_team_logo_path(player['team'])
-                            if logo_path and os.path.exists(logo_path):
-                                try:
-                                    st.image(logo_path, width=30)
-                                except Exception:
-                                    st.write("")
-                            else:
-                                st.write("")
-                        with col2:
-                            st.markdown(f"**{player['position']}** Rank #{player['rank']} - {player['name']} ({player['team']})")
-                else:
-                    st.info("No players to drop")
-                
-                st.write("")  # Spacing
-                
-                # Best adds section
-                st.markdown("**➕ ADD (Best Available)**")
-                if ros_analysis['best_adds']:
-                    # Sort by rank (best ranks first)
-                    sorted_adds = sorted(ros_analysis['best_adds'], key=lambda x: x['rank'])
-                    for player in sorted_adds[:8]:  # Top 8
-                        # Format: **{position}** Rank #{rank} - {name} ({team})
-                        col1, col2 = st.columns([0.08, 0.92])
-                        with col1:
-                            logo_path = get_team_logo_path(player['team'])
-                            if logo_path and os.path.exists(logo_path):
-                                try:
-                                    st.image(logo_path, width=30)
-                                except Exception:
-                                    st.write("")
-                            else:
-                                st.write("")
-                        with col2:
-                            st.markdown(f"**{player['position']}** Rank #{player['rank']} - {player['name']} ({player['team']})")
-                else:
-                    st.info("No free agents found")
-        else:
-            st.info("📁 No ROS rankings file found. Add FantasyPros_*_Ros_ALL_Rankings.csv to the weekly_rankings folder.")
+        render_ros_recommendations(
+            league_id, user_ids_key, league_ids_key, rankings_key, sleeper_players
+        )
     
     else:
         st.info("👈 Use the sidebar to discover your leagues and select one to analyze.")
@@ -1233,19 +1449,10 @@ def render_draft_assistant_page() -> None:
         st.write("No drafted players detected yet.")
     else:
         # Display drafted players with logos
-        for i, p in enumerate(drafted, start=1):
-            logo_path = get_team_logo_path(p.team)
-            col1, col2 = st.columns([0.08, 0.92])
-            with col1:
-                if logo_path and os.path.exists(logo_path):
-                    try:
-                        st.image(logo_path, width=30)
-                    except Exception:
-                        st.write("")
-                else:
-                    st.write("")
-            with col2:
-                st.markdown(f"{i}. **{p.name}** ({p.team}) — {p.position} #{p.position_rank}")
+        render_player_rows([
+            (p.team, f"{i}. <strong>{escape(p.name)}</strong> ({escape(p.team)}) — {escape(p.position)} #{p.position_rank}")
+            for i, p in enumerate(drafted, start=1)
+        ])
 
     # Optional debug: show unmatched drafted players from Sleeper (to diagnose missing mappings)
     with st.expander("Debug: Unmatched drafted players (from Sleeper)"):
@@ -1253,20 +1460,12 @@ def render_draft_assistant_page() -> None:
         if not unmatched:
             st.write("None")
         else:
-            for player_info in unmatched:
-                team = player_info.get('team', '')
-                logo_path = get_team_logo_path(team)
-                col1, col2 = st.columns([0.08, 0.92])
-                with col1:
-                    if logo_path and os.path.exists(logo_path):
-                        try:
-                            st.image(logo_path, width=25)
-                        except Exception:
-                            st.write("")
-                    else:
-                        st.write("")
-                with col2:
-                    st.write(f"**{player_info.get('full_name', 'Unknown')}** - {player_info.get('position', '')} - {team}")
+            render_player_rows([
+                (player_info.get('team', ''),
+                 f"<strong>{escape(str(player_info.get('full_name', 'Unknown')))}</strong> - "
+                 f"{escape(str(player_info.get('position', '')))} - {escape(str(player_info.get('team', '')))}")
+                for player_info in unmatched
+            ])
 
 
 def render_weekly_rankings_page() -> None: